@@ -1,31 +1,141 @@
+import atexit
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from loguru import logger
 
+_FILE_FORMAT = (
+    "%(asctime)s.%(msecs)03d | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s"
+)
+
+# One worker: rollovers compress in order and never pile up concurrent gzip jobs.
+# The pool shuts down at interpreter exit before our atexit listener.stop drain runs,
+# so a rollover during that drain compresses inline (see _threaded_gz_rotator)
+_GZ_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rot")
+
+
+def _gz_namer(name: str) -> str:
+    """Rotated files are stored compressed: nornir_debug.log.1 -> nornir_debug.log.1.gz"""
+    return name + ".gz"
+
+
+def _gzip_and_remove(src: str, dest: str) -> None:
+    try:
+        with open(src, "rb") as f_in, gzip.open(dest, "wb", compresslevel=1) as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(src)
+    except OSError as e:
+        # Can't log from here (we'd re-enter the handler); leave the plain file behind
+        print(f"log compression failed for {src}: {e}", file=sys.stderr)
+
+
+def _threaded_gz_rotator(source: str, dest: str) -> None:
+    """Rename synchronously, gzip on the background pool so rollover never blocks logging."""
+    # Unique staging name so back-to-back rollovers never race on the same file
+    plain = f"{source}.{time.monotonic_ns()}.tmp"
+    os.replace(source, plain)
+    try:
+        _GZ_POOL.submit(_gzip_and_remove, plain, dest)
+    except RuntimeError:
+        # Pool already shut down (interpreter exit): compress here rather than orphan the .tmp
+        _gzip_and_remove(plain, dest)
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that batches writes through a large stream buffer.
+
+    StreamHandler flushes after every record (one write(2) per line). Here the
+    per-record flush is skipped, so the OS sees one write per ``buffer_size``
+    bytes. The buffer is still flushed on rollover, on close, for
+    ERROR-and-above records so failures are on disk immediately, and by a
+    daemon thread every ``flush_interval`` seconds so a quiet log is never
+    stale for long. The size-based rollover check (a stat plus a second
+    format of the record) runs at most once per ``rollover_check_interval``.
+    """
 
-class InterceptHandler(logging.Handler):
-    """Bridge stdlib logging -> Loguru, preserving level and caller site."""
+    def __init__(
+        self,
+        filename,
+        *args,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 0.25,
+        rollover_check_interval: float = 1.0,
+        **kwargs,
+    ):
+        self.buffer_size = buffer_size
+        self.rollover_check_interval = rollover_check_interval
+        self._next_rollover_check = 0.0
+        super().__init__(filename, *args, **kwargs)
+        self._stop_flusher = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(
+                target=self._flush_every,
+                args=(flush_interval,),
+                name="log-flush",
+                daemon=True,
+            ).start()
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def _flush_every(self, interval: float) -> None:
+        while not self._stop_flusher.wait(interval):
+            with self.lock:
+                super().flush()
+
+    def shouldRollover(self, record):  # noqa: N802 (stdlib override)
+        now = time.monotonic()
+        if now < self._next_rollover_check:
+            return False
+        self._next_rollover_check = now + self.rollover_check_interval
+        return super().shouldRollover(record)
 
     def emit(self, record):
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            super().flush()
+
+    def flush(self):
+        # Called by StreamHandler.emit after every record; let the buffer fill
+        pass
+
+    def close(self):
+        self._stop_flusher.set()
+        super().flush()
+        super().close()
 
-        frame, depth = logging.currentframe(), 2
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
 
-        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+_CONSOLE_KEY = "console"
+
+
+def _console_filter(record, _get=dict.get) -> bool:
+    """Only allow messages explicitly marked for console output.
+
+    Runs for every record; dict.get is bound as a default so no attribute lookup happens per call.
+    """
+    return _get(record["extra"], _CONSOLE_KEY, False)
 
 
 def setup_logging(log_dir: str = "logs", console_level: str = "INFO"):
     """
-    Configure Loguru with dual-sink logging:
-    1. File sink: captures ALL logs at DEBUG level
+    Configure dual-sink logging:
+    1. File sink: captures ALL logs at DEBUG level via a stdlib QueueHandler ->
+       QueueListener -> RotatingFileHandler, so file I/O happens on the
+       listener thread and stdlib DEBUG floods never pass through Loguru
     2. Console sink: shows only explicit console.info/success/warning/error calls
 
     Returns:
@@ -43,34 +153,49 @@ def setup_logging(log_dir: str = "logs", console_level: str = "INFO"):
     # Remove default handler
     logger.remove()
 
-    # Intercept stdlib logging (Nornir, Netmiko, Paramiko, etc.)
-    logging.basicConfig(handlers=[InterceptHandler()], level=logging.DEBUG, force=True)
+    # 1) FILE SINK: Everything at DEBUG level, written by the listener thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))  # final format on file_handler
+    file_handler = BufferedRotatingFileHandler(
+        os.path.join(log_dir, "nornir_debug.log"),
+        maxBytes=10 * 1024 * 1024,
+        backupCount=7,
+        encoding="utf-8",
+        buffer_size=64 * 1024,
+    )
+    file_handler.namer = _gz_namer
+    file_handler.rotator = _threaded_gz_rotator
+    file_handler.setFormatter(logging.Formatter(_FILE_FORMAT, datefmt="%Y-%m-%d %H:%M:%S"))
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    # Drain the queue, then flush the 64 KB buffer (logging.shutdown runs after us)
+    atexit.register(file_handler.close)
+    atexit.register(listener.stop)
+
+    # Stdlib logging (Nornir, Netmiko, Paramiko, etc.) feeds the queue directly
+    logging.basicConfig(handlers=[queue_handler], level=logging.DEBUG, force=True)
 
     # Set levels for noisy libraries
     for name in ("nornir", "nornir.core", "paramiko", "netmiko", "urllib3"):
         logging.getLogger(name).setLevel(logging.DEBUG)
 
-    # 1) FILE SINK: Everything at DEBUG level
+    # Loguru calls share the same queue so the file keeps a single timeline
+    # Plain tracebacks and no per-write try/except: this sink sees every record
     logger.add(
-        os.path.join(log_dir, "nornir_debug.log"),
-        rotation="10 MB",
-        retention="7 days",
+        queue_handler,
         level="DEBUG",
-        enqueue=True,
-        backtrace=True,
+        format="{message}",
+        backtrace=False,
         diagnose=False,
-        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
+        catch=False,
     )
 
     # 2) CONSOLE SINK: Only messages tagged with console=True
-    def console_filter(record):
-        """Only allow messages explicitly marked for console output."""
-        return record["extra"].get("console", False)
-
     logger.add(
         sys.stdout,
         level=console_level,
-        filter=console_filter,
+        filter=_console_filter,
         colorize=True,
         format="<level>{message}</level>",
     )
@@ -1,52 +1,122 @@
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
 from loguru import logger
 
 _MISSING = object()
+_LEAF = object()  # trie marker: "a requested path ends here"
 
 
 def get_nested(
     data: dict | list, *path: str | int, default: Any = _MISSING, strict: bool = False
 ) -> Any:
-    """Dynamic, safe traversal using Python 3.10+ structural pattern matching."""
+    """Dynamic, safe traversal of nested dicts/lists via a plain isinstance ladder."""
+    miss = None if default is _MISSING else default
+    # Caller supplied a default and doesn't want errors: misses are expected, skip diagnostics
+    cheap = not strict and default is not _MISSING
     cur = data
     for i, key in enumerate(path, 1):
-        try:
-            match cur, key:
-                case dict() as d, str() as k:
-                    if k in d:
-                        cur = d[k]
-                    else:
-                        msg = f"Key '{k}' not found at path: {path[:i]}"
-                        if strict:
-                            raise KeyError(msg)
-                        logger.debug(msg)
-                        return None if default is _MISSING else default
-                case list() as lst, int() as idx:
-                    try:
-                        cur = lst[idx]
-                    except IndexError as e:
-                        msg = f"Index {idx} out of range at path: {path[:i]}"
-                        if strict:
-                            raise IndexError(msg) from e
-                        logger.debug(msg)
-                        return None if default is _MISSING else default
-                case dict(), int() | list(), str():
-                    exp = "dict" if isinstance(key, str) else "list"
-                    act = type(cur).__name__
-                    msg = f"Type mismatch at {path[:i]} - expected {exp}, got {act}"
+        if isinstance(cur, dict):
+            if isinstance(key, str):
+                v = cur.get(key, _MISSING)
+                if v is not _MISSING:
+                    cur = v
+                    continue
+                if cheap:
+                    return miss
+                if strict:
+                    raise KeyError(f"Key '{key}' not found at path: {path[:i]}")
+                logger.opt(lazy=True).debug(
+                    "Key '{}' not found at path: {}", lambda: key, lambda: path[:i]
+                )
+                return miss
+            exp = "list"
+        elif isinstance(cur, list):
+            if isinstance(key, int):
+                try:
+                    cur = cur[key]
+                    continue
+                except IndexError as e:
+                    if cheap:
+                        return miss
                     if strict:
-                        raise TypeError(msg)
-                    logger.debug(msg)
-                    return None if default is _MISSING else default
-                case _:
-                    msg = f"Unsupported structure at {path[:i]} (type: {type(cur).__name__})"
-                    if strict:
-                        raise TypeError(msg)
-                    logger.debug(msg)
-                    return None if default is _MISSING else default
-        except (TypeError, KeyError, IndexError):
+                        raise IndexError(f"Index {key} out of range at path: {path[:i]}") from e
+                    logger.opt(lazy=True).debug(
+                        "Index {} out of range at path: {}", lambda: key, lambda: path[:i]
+                    )
+                    return miss
+            exp = "dict"
+        else:
+            if cheap:
+                return miss
             if strict:
-                raise
-            return None if default is _MISSING else default
+                raise TypeError(f"Unsupported structure at {path[:i]} (type: {type(cur).__name__})")
+            logger.opt(lazy=True).debug(
+                "Unsupported structure at {} (type: {})",
+                lambda: path[:i],
+                lambda: type(cur).__name__,
+            )
+            return miss
+
+        # dict indexed with a non-str key, or list indexed with a non-int key
+        if cheap:
+            return miss
+        if strict:
+            raise TypeError(
+                f"Type mismatch at {path[:i]} - expected {exp}, got {type(cur).__name__}"
+            )
+        logger.opt(lazy=True).debug(
+            "Type mismatch at {} - expected {}, got {}",
+            lambda: path[:i],
+            lambda: exp,
+            lambda: type(cur).__name__,
+        )
+        return miss
     return cur
+
+
+@lru_cache(maxsize=128)
+def _build_trie(paths: tuple[tuple[str | int, ...], ...]) -> dict:
+    """Nested dict of key -> subtrie; _LEAF holds the full path that ends at a node."""
+    trie: dict = {}
+    for p in paths:
+        node = trie
+        for key in p:
+            node = node.setdefault(key, {})
+        node[_LEAF] = p
+    return trie
+
+
+def get_nested_many(
+    data: dict | list, paths: Iterable[tuple[str | int, ...]], default: Any = None
+) -> dict[tuple[str | int, ...], Any]:
+    """
+    Fetch many paths from the same root in one walk over a trie of the paths.
+
+    Shared prefixes are traversed once. Same typing rules as get_nested (dicts
+    take str keys, lists take int indexes); any path that misses maps to
+    `default`.
+
+    Usage:
+        get_nested_many(cfg, [("ip", "address", "primary", "address"),
+                              ("ip", "address", "primary", "mask")])
+    """
+    paths = tuple(tuple(p) for p in paths)
+    out = dict.fromkeys(paths, default)
+    stack = [(data, _build_trie(paths))]
+    while stack:
+        cur, node = stack.pop()
+        for key, child in node.items():
+            if key is _LEAF:
+                out[child] = cur
+            elif isinstance(cur, dict) and isinstance(key, str):
+                v = cur.get(key, _MISSING)
+                if v is not _MISSING:
+                    stack.append((v, child))
+            elif isinstance(cur, list) and isinstance(key, int):
+                try:
+                    stack.append((cur[key], child))
+                except IndexError:
+                    pass
+    return out
@@ -0,0 +1,198 @@
+import contextlib
+import hashlib
+import os
+import pickle
+import stat
+import tempfile
+from typing import Any
+
+import yaml
+from loguru import logger
+from nornir.core import Nornir
+from nornir.core.configuration import Config
+from nornir.core.inventory import Inventory
+from nornir.core.plugins.connections import ConnectionPluginRegister
+from nornir.core.state import GlobalState
+from nornir.init_nornir import load_inventory, load_runner
+from nornir.plugins.inventory.simple import SimpleInventory
+
+# libyaml-backed loader when available; SimpleInventory parses with pure-Python ruamel
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "nornir")
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Owned by us and not accessible to group/other (the pickles hold device passwords)."""
+    return hasattr(os, "getuid") and st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def _private_cache_dir() -> str | None:
+    """Create the cache dir 0700 (tightening one of ours); None if it belongs to someone else."""
+    path = _cache_dir()
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not _is_private(st) and hasattr(os, "getuid") and st.st_uid == os.getuid():
+        os.chmod(path, 0o700)  # created world-readable by an older version
+        st = os.lstat(path)
+    return path if stat.S_ISDIR(st.st_mode) and _is_private(st) else None
+
+
+def _source_mtimes(config_file: str, config: Config) -> dict[str, float]:
+    """mtime of the config file plus every inventory option that names a file on disk."""
+    paths = [config_file]
+    for value in (config.inventory.options or {}).values():
+        if isinstance(value, str) and os.path.isfile(value):
+            paths.append(value)
+    return {os.path.abspath(p): os.stat(p).st_mtime for p in paths}
+
+
+def cached_init_nornir(
+    config_file: str,
+    dry_run: bool = False,
+    *,
+    connection_plugins: bool = True,
+    **kwargs: Any,
+) -> Nornir:
+    """
+    Drop-in for InitNornir(config_file=...) that memoizes the parsed inventory.
+
+    The inventory is pickled to ~/.cache/nornir/<sha1>.pkl, keyed by the config
+    path and kwargs, and reused while the config and inventory YAML mtimes are
+    unchanged. It includes device credentials, so the directory is 0700, the
+    file 0600, and a cache file not owned by (and private to) us is never loaded. Runner, config and connection plugins are always built fresh.
+
+    connection_plugins=False skips entry-point registration of connection
+    plugins (netmiko/paramiko import) for callers that never open a connection.
+    """
+    if connection_plugins:
+        ConnectionPluginRegister.auto_register()
+    config = Config.from_file(config_file, **kwargs)
+    config.logging.configure()
+
+    key = hashlib.sha1(f"{os.path.abspath(config_file)}|{sorted(kwargs.items())!r}".encode())
+    mtimes = _source_mtimes(config_file, config)
+    try:
+        cache_dir = _private_cache_dir()
+    except OSError as e:
+        logger.debug(f"Nornir inventory cache unavailable: {e}")
+        cache_dir = None
+    if cache_dir is None:
+        logger.debug(f"Nornir inventory cache disabled: {_cache_dir()} is not private")
+    cache_path = os.path.join(cache_dir or _cache_dir(), f"{key.hexdigest()}.pkl")
+
+    inventory = None
+    if cache_dir is not None:
+        try:
+            # O_NOFOLLOW + fstat: only unpickle a regular file that we own and nobody else
+            # can read or write
+            fd = os.open(cache_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+            with os.fdopen(fd, "rb") as f:
+                if not _is_private(os.fstat(f.fileno())):
+                    raise PermissionError("cache file is not private to this user")
+                cached = pickle.load(f)
+            if cached.get("mtimes") == mtimes:
+                inventory = cached["inventory"]
+                logger.debug(f"Nornir inventory loaded from cache: {cache_path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unusable Nornir inventory cache {cache_path}: {e}")
+
+    if inventory is None:
+        inventory = load_inventory(config)
+        if cache_dir is not None:
+            try:
+                tmp = f"{cache_path}.{os.getpid()}.tmp"
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(tmp)  # O_EXCL below: never reuse a leftover file's mode
+                fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        {"mtimes": mtimes, "inventory": inventory}, f, pickle.HIGHEST_PROTOCOL
+                    )
+                os.replace(tmp, cache_path)
+                logger.debug(f"Nornir inventory cached to {cache_path}")
+            except Exception as e:
+                logger.debug(f"Could not cache Nornir inventory: {e}")
+
+    return Nornir(
+        inventory=inventory,
+        runner=load_runner(config),
+        config=config,
+        data=GlobalState(dry_run=dry_run),
+    )
+
+
+def _load_yaml(path: str) -> Any:
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _single_host_inventory(config: Config, host: str) -> Inventory | None:
+    """
+    SimpleInventory restricted to the host(s) named `host` or with that hostname.
+
+    The matching hosts.yaml entries are written to a private temp hosts.yaml and
+    loaded through SimpleInventory with the configured groups/defaults files, so
+    only those Host objects are built. Returns None whenever the fast path can't
+    give the same answer as the full load: another inventory plugin, a transform
+    function, or no direct match in hosts.yaml.
+    """
+    if config.inventory.plugin != "SimpleInventory" or config.inventory.transform_function:
+        return None
+
+    options = config.inventory.options or {}
+    hosts_dict = _load_yaml(os.path.expanduser(options.get("host_file", "hosts.yaml"))) or {}
+    selected = {
+        n: h for n, h in hosts_dict.items() if n == host or (h or {}).get("hostname") == host
+    }
+    if not selected:
+        return None
+
+    # mkdtemp is 0700: the subset still carries the host's credentials
+    with tempfile.TemporaryDirectory(prefix="nornir-host-") as tmp:
+        host_file = os.path.join(tmp, "hosts.yaml")
+        with open(host_file, "w", encoding=options.get("encoding", "utf-8")) as f:
+            yaml.dump(selected, f, Dumper=_YamlDumper)
+        return SimpleInventory(**{**options, "host_file": host_file}).load()
+
+
+def init_nornir_for_host(
+    config_file: str,
+    host: str,
+    dry_run: bool = False,
+    *,
+    connection_plugins: bool = True,
+    **kwargs: Any,
+) -> Nornir:
+    """
+    Like cached_init_nornir, but only builds the inventory entries for `host`.
+
+    For CLI runs that target one device there is no point parsing and building
+    every host. Falls back to cached_init_nornir (full inventory) when the
+    fast path can't resolve `host` directly from hosts.yaml.
+    """
+    if connection_plugins:
+        ConnectionPluginRegister.auto_register()
+    config = Config.from_file(config_file, **kwargs)
+
+    inventory = _single_host_inventory(config, host)
+    if inventory is None:
+        logger.debug(f"No direct inventory match for {host!r}, loading full inventory")
+        return cached_init_nornir(
+            config_file, dry_run, connection_plugins=connection_plugins, **kwargs
+        )
+
+    config.logging.configure()
+    logger.debug(f"Nornir inventory built for {len(inventory.hosts)} host(s) matching {host!r}")
+    return Nornir(
+        inventory=inventory,
+        runner=load_runner(config),
+        config=config,
+        data=GlobalState(dry_run=dry_run),
+    )
@@ -0,0 +1,82 @@
+"""Shared entry point for the run_*.py RESTCONF scripts.
+
+The scripts only differ in which task module they use and how it is fanned out,
+so argument parsing, Nornir init, host filtering and result printing live here.
+"""
+
+import argparse
+from collections.abc import Callable
+from typing import Any
+
+from nornir.core.filter import F
+from nornir.core.task import Result
+
+from cisco_8000v_basics.automation.lib.logging_setup import setup_logging
+from cisco_8000v_basics.automation.lib.nornir_init import init_nornir_for_host
+from cisco_8000v_basics.net.nornir.fanout import run_on_hosts
+
+Runner = Callable[..., dict[str, Result]]
+
+PARSER = argparse.ArgumentParser(description="RESTCONF GET against Nornir inventory hosts")
+PARSER.add_argument("--host", required=True, help="inventory name or hostname")
+PARSER.add_argument(
+    "--path",
+    required=True,
+    help="RESTCONF data path, e.g. 'openconfig-interfaces:interfaces/interface'",
+)
+
+
+def main_with(
+    task_fn: Callable[..., Any], runner: Runner = run_on_hosts, argv: list[str] | None = None
+) -> int:
+    """Parse args, filter inventory, run `task_fn` via `runner(task_fn, hosts, path=...)`."""
+    args = PARSER.parse_args(argv)
+
+    logger, console = setup_logging()
+
+    # Log script invocation details
+    logger.debug(f"Script started with args: host={args.host}, path={args.path}")
+
+    # Initialize Nornir
+    logger.debug("Initializing Nornir with config.yaml (inventory for --host only)")
+    # RESTCONF tasks never open a Nornir connection: skip loading netmiko/paramiko
+    nr = init_nornir_for_host(
+        "config.yaml", args.host, logging={"enabled": False}, connection_plugins=False
+    )
+    logger.debug(f"Nornir initialized with {len(nr.inventory.hosts)} total hosts")
+
+    # Filter hosts (single inventory pass: name or hostname)
+    logger.debug(f"Filtering by name or hostname: {args.host}")
+    flt = nr.filter(F(name=args.host) | F(hostname=args.host))
+
+    if not flt.inventory.hosts:
+        logger.error(f"Host filter failed: no match for '{args.host}'")
+        console.error(f"No hosts matched filter: {args.host}")
+        return 2
+
+    hosts = list(flt.inventory.hosts.values())
+    matched_hosts = list(flt.inventory.hosts.keys())
+    logger.debug(f"Filter matched {len(matched_hosts)} host(s): {matched_hosts}")
+
+    console.info(f"RESTCONF GET on: {matched_hosts} path={args.path}")
+
+    logger.debug(f"Executing {task_fn.__name__} on {len(matched_hosts)} host(s)")
+    res = runner(task_fn, hosts, path=args.path)
+    logger.debug(f"Task completed for {len(res)} host(s)")
+
+    # Process results: build the whole report, emit it as a single console record
+    lines: list[str] = []
+    for h, r in res.items():
+        status = "FAILED" if r.failed else "OK"
+        logger.debug(f"[{h}] status={status}, changed={r.changed}")
+        lines.append(f"[{h}] {status}")
+        if r.result:
+            lines.append(str(r.result))
+            logger.debug(f"[{h}] Result length: {len(str(r.result))} chars")
+        if r.failed and r.exception:
+            logger.debug(f"[{h}] Exception details: {r.exception}")
+    console.info("\n".join(lines))
+
+    logger.debug("Script completed successfully")
+
+    return 0
@@ -0,0 +1,52 @@
+"""Thread-pool fan-out for host tasks that only need ``task.host``.
+
+The RESTCONF tasks are plain HTTP calls; running them through ``nr.run`` pays
+Nornir's per-host scheduling/MultiResult overhead for no benefit. This runs the
+same task functions on a ThreadPoolExecutor with concurrency gated by a
+BoundedSemaphore, and returns one Result per host name.
+"""
+
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from loguru import logger
+from nornir.core.inventory import Host
+from nornir.core.task import Result
+
+MAX_WORKERS = 64
+
+# Shared across calls so concurrency stays bounded even if fan-outs overlap
+_GATE = threading.BoundedSemaphore(MAX_WORKERS)
+
+
+class _HostTask:
+    """Minimal stand-in for nornir's Task: the RESTCONF tasks only touch .host"""
+
+    __slots__ = ("host",)
+
+    def __init__(self, host: Host):
+        self.host = host
+
+
+def run_on_hosts(
+    task_fn: Callable[..., Result], hosts: Iterable[Host], **kwargs: Any
+) -> dict[str, Result]:
+    """Run ``task_fn(task, **kwargs)`` for every host concurrently."""
+    hosts = list(hosts)
+    if not hosts:
+        return {}
+
+    def _one(host: Host) -> Result:
+        with _GATE:
+            try:
+                return task_fn(_HostTask(host), **kwargs)
+            except Exception as e:
+                logger.exception(f"[{host.name}] {task_fn.__name__} raised")
+                return Result(host=host, failed=True, result=str(e), exception=e)
+
+    workers = min(MAX_WORKERS, len(hosts))
+    logger.debug(f"Fan-out {task_fn.__name__} to {len(hosts)} host(s) on {workers} worker(s)")
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return {h.name: r for h, r in zip(hosts, ex.map(_one, hosts))}
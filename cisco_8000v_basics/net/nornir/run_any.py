@@ -0,0 +1,32 @@
+"""Single entry point for every run mode; only the chosen transport gets imported.
+
+    python -m cisco_8000v_basics.net.nornir.run_any --mode httpx --host R1 --path ...
+    python -m cisco_8000v_basics.net.nornir.run_any --mode ssh --cmd "show version"
+
+Everything after --mode is handed to that mode's own parser, so e.g. an SSH run
+never pays for httpx and a RESTCONF run never loads nornir_netmiko/paramiko.
+"""
+
+import argparse
+import importlib
+
+MODES = {
+    "httpx": "cisco_8000v_basics.net.nornir.run_httpx",
+    "httpx-bk": "cisco_8000v_basics.net.nornir.run_httpx_bk",
+    "rest": "cisco_8000v_basics.net.nornir.run_rest",
+    "ssh": "cisco_8000v_basics.net.nornir.run_ssh",
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0], add_help=False)
+    p.add_argument("--mode", choices=MODES, default="httpx", help="transport (default: httpx)")
+    args, rest = p.parse_known_args(argv)
+
+    # Deferred import: the mode's module pulls in only its own transport stack
+    module = importlib.import_module(MODES[args.mode])
+    return module.main(rest)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,76 +1,52 @@
 # import sys
 # sys.path.insert(0, '/home/sparty/Scott_NetEng_project')
 
-import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
 
-from nornir import InitNornir
-from nornir.core.filter import F
+from nornir.core.inventory import Host
+from nornir.core.task import Result
 
-from cisco_8000v_basics.automation.lib.logging_setup import setup_logging
-from cisco_8000v_basics.net.nornir.tasks.show_httpx import restconf_close, restconf_get
+from cisco_8000v_basics.net.nornir._cli import main_with
+from cisco_8000v_basics.net.nornir.tasks.show_httpx import arestconf_close, arestconf_get
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows; plain asyncio loop works the same
+    uvloop = None
 
-def main():
-    p = argparse.ArgumentParser()
-    p.add_argument("--host", required=True, help="inventory name or hostname")
-    p.add_argument(
-        "--path",
-        required=True,
-        help="RESTCONF data path, e.g. 'openconfig-interfaces:interfaces/interface'",
-    )
-    args = p.parse_args()
+AsyncTask = Callable[[Host, str], Awaitable[Result]]
 
-    logger, console = setup_logging()
 
-    # Log script invocation details
-    logger.debug(f"Script started with args: host={args.host}, path={args.path}")
+async def _run_all(task_fn: AsyncTask, hosts: list[Host], path: str) -> dict[str, Result]:
+    """Run `task_fn(host, path)` for every host concurrently on one event loop.
 
-    # Initialize Nornir
-    logger.debug("Initializing Nornir with config.yaml")
-    nr = InitNornir(config_file="config.yaml", logging={"enabled": False})
-    logger.debug(f"Nornir initialized with {len(nr.inventory.hosts)} total hosts")
+    One host raising does not cancel the others; its exception becomes a failed Result.
+    """
+    try:
+        results = await asyncio.gather(*(task_fn(h, path) for h in hosts), return_exceptions=True)
+    finally:
+        await asyncio.gather(*(arestconf_close(h) for h in hosts), return_exceptions=True)
+    return {
+        h.name: (
+            Result(host=h, failed=True, exception=r, result=f"{type(r).__name__}: {r}")
+            if isinstance(r, BaseException)
+            else r
+        )
+        for h, r in zip(hosts, results)
+    }
 
-    # Filter hosts
-    logger.debug(f"Filtering by name: {args.host}")
-    flt = nr.filter(F(name=args.host))
-    if not flt.inventory.hosts:
-        logger.debug(f"No match by name, trying hostname: {args.host}")
-        flt = nr.filter(F(hostname=args.host))
 
-    if not flt.inventory.hosts:
-        logger.error(f"Host filter failed: no match for '{args.host}'")
-        console.error(f"No hosts matched filter: {args.host}")
-        return 2
+def _run_async(task_fn: AsyncTask, hosts: list[Host], path: str) -> dict[str, Result]:
+    """Drive `_run_all` to completion, on uvloop when it is installed."""
+    coro = _run_all(task_fn, list(hosts), path)
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
 
-    matched_hosts = list(flt.inventory.hosts.keys())
-    logger.debug(f"Filter matched {len(matched_hosts)} host(s): {matched_hosts}")
 
-    console.info(f"RESTCONF GET on: {matched_hosts} path={args.path}")
-
-    # Run the task
-    logger.debug(f"Executing restconf_get task on {len(matched_hosts)} host(s)")
-    res = flt.run(task=restconf_get, path=args.path)
-    logger.debug(f"Task completed for {len(res)} host(s)")
-
-    # Process results
-    for h, multi in res.items():
-        logger.debug(f"Processing results for host: {h} ({len(multi)} result(s))")
-        for idx, r in enumerate(multi):
-            status = "FAILED" if r.failed else "OK"
-            logger.debug(f"[{h}] Result {idx}: status={status}, changed={r.changed}")
-            console.info(f"[{h}] {status}")
-            if r.result:
-                console.info(r.result)
-                logger.debug(f"[{h}] Result length: {len(str(r.result))} chars")
-            if r.failed and r.exception:
-                logger.debug(f"[{h}] Exception details: {r.exception}")
-
-    # Cleanup
-    logger.debug("Closing RESTCONF clients")
-    flt.run(task=restconf_close)
-    logger.debug("Script completed successfully")
-
-    return 0
+def main(argv: list[str] | None = None) -> int:
+    return main_with(arestconf_get, runner=_run_async, argv=argv)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,32 @@
-from automation.lib.logging_setup import setup_logging
-from net.nornir.tasks.show_ssh import show_router_interface
-from nornir import InitNornir
+import argparse
+
 from nornir_utils.plugins.functions import print_result
 
+from cisco_8000v_basics.automation.lib.logging_setup import setup_logging
+from cisco_8000v_basics.automation.lib.nornir_init import cached_init_nornir
+from cisco_8000v_basics.net.nornir.tasks.show_ssh import show_router_interface
+
 
-def main():
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Run a show command on every inventory host")
+    p.add_argument("--cmd", default="show ip interface brief", help="CLI command to run")
+    args = p.parse_args(argv)
 
     logger, console = setup_logging()
 
-    nr = InitNornir(config_file="config.yaml", logging={"enabled": False})
+    nr = cached_init_nornir("config.yaml", logging={"enabled": False})
 
-    result = nr.run(task=show_router_interface)
+    result = nr.run(task=show_router_interface, cmd=args.cmd)
 
-    # Print user-facing summary to console
+    # Print user-facing summary to console (one record for the whole report)
+    lines: list[str] = []
     for h, multi in result.items():
         for r in multi:
             status = "FAILED" if r.failed else "OK"
-            console.info(f"[{h}] {r.name}: {status}")
+            lines.append(f"[{h}] {r.name}: {status}")
             if r.result:
-                console.info(r.result)
+                lines.append(str(r.result))
+    console.info("\n".join(lines))
 
     # Also print full Nornir result tree to console if desired:
     print_result(result)
@@ -1,10 +1,19 @@
-import json
+import asyncio
+import atexit
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
+from nornir.core.inventory import Host
 from nornir.core.task import Result, Task
 
+from cisco_8000v_basics.net.nornir.fanout import run_on_hosts
+
 HEADERS = {
     "Accept": "application/yang-data+json",
     "Content-Type": "application/yang-data+json",
@@ -12,264 +21,386 @@ HEADERS = {
 
 _STORE_KEY = "_restconf_httpx"  # where we keep per-host client in host.data
 
+# One pooled HTTP/2 client per endpoint config (base_url, credentials, verify), shared
+# by every host and task that points at the same endpoint for the life of the process
+_CLIENTS: dict["_RcConfig", httpx.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Connection limits for both the shared sync clients and the per-host AsyncClients
+_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=128)
+
 
 def _get_store(task: Task) -> dict[str, Any]:
     """Ensure a dedicated namespace in host.data"""
-    store = task.host.data.get(_STORE_KEY)
+    return _get_host_store(task.host)
+
+
+def _get_host_store(host: Host) -> dict[str, Any]:
+    store = host.data.get(_STORE_KEY)
     if store is None:
-        logger.debug(f"[{task.host.name}] Initializing store key '{_STORE_KEY}'")
+        logger.debug(f"[{host.name}] Initializing store key '{_STORE_KEY}'")
         store = {}
-        task.host.data[_STORE_KEY] = store
+        host.data[_STORE_KEY] = store
     return store
 
 
-def _get_client(task: Task) -> httpx.Client:
-    store = _get_store(task)
-    client = store.get("client")
+@dataclass(frozen=True, slots=True)
+class _RcConfig:
+    """Validated restconf host data; hashable, so it doubles as the _CLIENTS key."""
+
+    base: str
+    auth: tuple[str, str]
+    verify: bool
+
 
-    if client:
-        if client.is_closed:  # ← Add this check
-            logger.debug(f"[{task.host.name}] Client was closed, creating new one")
-            store.pop("client", None)
-        else:
-            logger.debug(f"[{task.host.name}] Reusing existing httpx.Client")
-            return client
+def _get_rc_config(host: Host) -> _RcConfig:
+    """Parse and validate host.data["restconf"] once, then serve it from the host store."""
+    store = _get_host_store(host)
+    cfg = store.get("config")
+    if cfg is not None:
+        return cfg
 
     # Extract RESTCONF config from host data
-    rc: dict[str, Any] = task.host.data.get("restconf", {})
+    rc: dict[str, Any] = host.data.get("restconf", {})
     base = rc.get("base_url")
     user = rc.get("username")
     pwd = rc.get("password")
     verify = rc.get("verify_ssl", True)
 
     logger.debug(
-        f"[{task.host.name}] RESTCONF config: base_url={base}, username={user}, verify_ssl={verify}"
+        "[{}] RESTCONF config: base_url={}, username={}, verify_ssl={}",
+        host.name,
+        base,
+        user,
+        verify,
     )
 
     if not base or not user or not pwd:
-        logger.error(f"[{task.host.name}] Missing required RESTCONF credentials in host data")
+        logger.error(f"[{host.name}] Missing required RESTCONF credentials in host data")
         raise ValueError("Missing restconf.base_url/username/password in host data")
 
-    # Create new client
-    logger.debug(f"[{task.host.name}] Creating new httpx.Client with base_url={base}")
-    client = httpx.Client(
-        base_url=base.rstrip("/"),
-        auth=(user, pwd),  # Note: password not logged (security)
-        headers=HEADERS,
-        verify=verify,
-        timeout=30.0,  # Added explicit timeout
-    )
+    cfg = _RcConfig(base=base.rstrip("/"), auth=(user, pwd), verify=verify)
+    store["config"] = cfg
+    return cfg
+
+
+def _get_client(task: Task) -> httpx.Client:
+    store = _get_store(task)
+    client = store.get("client")
+    if client is not None and not client.is_closed:
+        return client
+
+    cfg = _get_rc_config(task.host)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(cfg)
+        if client is None or client.is_closed:
+            logger.debug("[{}] Creating shared httpx.Client for {}", task.host.name, cfg.base)
+            client = httpx.Client(
+                base_url=cfg.base,
+                auth=cfg.auth,  # Note: password not logged (security)
+                headers=HEADERS,
+                verify=cfg.verify,
+                timeout=30.0,
+                http2=True,  # warmed connection is multiplexed by later requests
+                limits=_LIMITS,
+            )
+            _CLIENTS[cfg] = client
     store["client"] = client
-    logger.debug(f"[{task.host.name}] httpx.Client created and stored")
     return client
 
 
+@lru_cache(maxsize=1024)
+def _make_url(path: str) -> str:
+    """RESTCONF data URL for `path`; the same few paths are requested over and over."""
+    return f"/data/{path.strip('/')}"
+
+
+def _warm_client(task: Task) -> Result:
+    client = _get_client(task)
+    try:
+        # Cheap RESTCONF resource; only here to complete TCP+TLS on the pooled client
+        resp = client.get("/yang-library-version")
+    except httpx.HTTPError as e:
+        logger.debug(f"[{task.host.name}] Warm-up request failed: {e}")
+        return Result(host=task.host, result=str(e), changed=False, failed=True)
+    # Anything but a 2xx means no usable RESTCONF endpoint answered (e.g. a proxy 404)
+    return Result(host=task.host, result="warm", changed=False, failed=not resp.is_success)
+
+
+def warm_clients(hosts: Iterable[Host]) -> dict[str, Result]:
+    """Pre-create clients and handshake with every host concurrently.
+
+    Call once after filtering so the first real task doesn't pay the TLS
+    handshake; startup then costs max(handshake) instead of sum(handshake).
+    A host's Result is failed if its RESTCONF root didn't answer with a 2xx.
+    """
+    return run_on_hosts(_warm_client, hosts)
+
+
+def _decode_json(resp: httpx.Response) -> Any:
+    """Decode a JSON body with orjson, falling back to the raw text"""
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
+        return resp.text
+
+
 def _pretty_json(body: Any) -> str:
     """Format JSON for display"""
     try:
-        return json.dumps(body, indent=2)
-    except Exception as e:
+        return orjson.dumps(body, option=orjson.OPT_INDENT_2).decode()
+    except TypeError as e:
         logger.debug(f"JSON formatting failed: {e}, returning raw string")
         return str(body)
 
 
-def restconf_get(task: Task, path: str) -> Result:
-    """Execute RESTCONF GET request"""
-    logger.debug(f"[{task.host.name}] Starting RESTCONF GET for path: {path}")
+def _pretty_body(resp: httpx.Response) -> str:
+    """Pretty-print a GET body straight from the response bytes.
+
+    The decoded tree is a temporary that dies as soon as it is re-serialized,
+    so large YANG payloads never keep both the object tree and the string alive.
+    """
+    if "json" in resp.headers.get("content-type", ""):
+        try:
+            return orjson.dumps(orjson.loads(resp.content), option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONDecodeError:
+            pass
+    return _pretty_json(resp.text)
+
+
+def _request(
+    task: Task,
+    method: str,
+    path: str,
+    payload: dict[str, Any] | None = None,
+    raw: bool = False,
+) -> Result:
+    """Shared request/response handling for the sync RESTCONF verbs."""
+    host = task.host
+    logger.debug("[{}] Starting RESTCONF {} for path: {}", host.name, method, path)
 
     try:
         client = _get_client(task)
     except ValueError as e:
-        logger.error(f"[{task.host.name}] Failed to get client: {e}")
-        return Result(host=task.host, failed=True, result=str(e))
+        logger.error(f"[{host.name}] Failed to get client: {e}")
+        return Result(host=host, failed=True, result=str(e))
+
+    url = _make_url(path)
+    logger.debug("[{}] Full URL: {}{}", host.name, client.base_url, url)
 
-    url = f"/data/{path.strip('/')}"
-    logger.debug(f"[{task.host.name}] Full URL: {client.base_url}{url}")
+    content = None
+    if payload is not None:
+        logger.opt(lazy=True).debug(
+            "[{}] Payload keys: {}", lambda: host.name, lambda: list(payload)
+        )
+        # Serialize once with orjson; the same bytes are sized for the log and sent
+        content = orjson.dumps(payload)
+        logger.debug("[{}] Payload size: {} bytes", host.name, len(content))
 
     try:
-        logger.debug(f"[{task.host.name}] Sending GET request...")
-        resp = client.get(url)
-        logger.debug(f"[{task.host.name}] Response status: {resp.status_code}")
-        logger.debug(f"[{task.host.name}] Response headers: {dict(resp.headers)}")
+        logger.debug("[{}] Sending {} request...", host.name, method)
+        resp = client.request(method, url, content=content)
+        logger.debug("[{}] Response status: {}", host.name, resp.status_code)
+
+        if method == "GET":
+            logger.opt(lazy=True).debug(
+                "[{}] Response headers: {}", lambda: host.name, lambda: dict(resp.headers)
+            )
 
         resp.raise_for_status()
 
-        content_type = resp.headers.get("content-type", "")
-        logger.debug(f"[{task.host.name}] Content-Type: {content_type}")
+        if method == "GET":
+            logger.debug("[{}] Content-Type: {}", host.name, resp.headers.get("content-type", ""))
+            logger.debug("[{}] Response size: {} bytes", host.name, len(resp.content))
+            if raw:
+                return Result(host=host, result=resp.content, changed=False)
+            return Result(host=host, result=_pretty_body(resp), changed=False)
 
-        content = resp.json() if "json" in content_type else resp.text
-        logger.debug(f"[{task.host.name}] Response size: {len(str(content))} chars")
+        logger.debug("[{}] {} successful", host.name, method)
+        if method == "DELETE":
+            return Result(host=host, result="deleted", changed=True)
 
-        return Result(host=task.host, result=_pretty_json(content), changed=False)
+        body = _decode_json(resp) if resp.content else {"status": "ok"}
+        return Result(host=host, result=_pretty_json(body), changed=True)
 
     except httpx.HTTPStatusError as e:
-        logger.error(
-            f"[{task.host.name}] HTTP error {e.response.status_code}: {e.response.text[:200]}"
-        )
+        logger.error(f"[{host.name}] HTTP error {e.response.status_code}: {e.response.text[:200]}")
         return Result(
-            host=task.host,
+            host=host,
             failed=True,
-            result=f"GET {url} -> {e.response.status_code} {e.response.text}",
+            result=f"{method} {url} -> {e.response.status_code} {e.response.text}",
         )
     except httpx.TimeoutException as e:
-        logger.error(f"[{task.host.name}] Request timeout: {e}")
-        return Result(host=task.host, failed=True, result=f"GET {url} timed out: {e}")
+        logger.error(f"[{host.name}] Request timeout: {e}")
+        return Result(host=host, failed=True, result=f"{method} {url} timed out: {e}")
     except Exception as e:
-        logger.error(f"[{task.host.name}] Unexpected error: {type(e).__name__}: {e}")
-        logger.exception(f"[{task.host.name}] Full traceback:")
-        return Result(host=task.host, failed=True, result=f"GET {url} failed: {e}")
+        logger.error(f"[{host.name}] Unexpected error: {type(e).__name__}: {e}")
+        logger.exception(f"[{host.name}] Full traceback:")
+        return Result(host=host, failed=True, result=f"{method} {url} failed: {e}")
+
+
+def restconf_get(task: Task, path: str, raw: bool = False) -> Result:
+    """Execute RESTCONF GET request
+
+    raw=True returns the response body as bytes, skipping the pretty-print pass;
+    use it when the caller parses the JSON itself.
+    """
+    return _request(task, "GET", path, raw=raw)
 
 
 def restconf_put(task: Task, path: str, payload: dict[str, Any]) -> Result:
     """Execute RESTCONF PUT request"""
-    logger.debug(f"[{task.host.name}] Starting RESTCONF PUT for path: {path}")
+    return _request(task, "PUT", path, payload)
 
-    try:
-        client = _get_client(task)
-    except ValueError as e:
-        logger.error(f"[{task.host.name}] Failed to get client: {e}")
-        return Result(host=task.host, failed=True, result=str(e))
 
-    url = f"/data/{path.strip('/')}"
-    logger.debug(f"[{task.host.name}] Full URL: {client.base_url}{url}")
-    logger.debug(f"[{task.host.name}] Payload keys: {list(payload.keys())}")
-    logger.debug(f"[{task.host.name}] Payload size: {len(json.dumps(payload))} bytes")
+def restconf_patch(task: Task, path: str, payload: dict[str, Any]) -> Result:
+    """Execute RESTCONF PATCH request"""
+    return _request(task, "PATCH", path, payload)
+
 
-    try:
-        logger.debug(f"[{task.host.name}] Sending PUT request...")
-        resp = client.put(url, json=payload)
-        logger.debug(f"[{task.host.name}] Response status: {resp.status_code}")
+def restconf_delete(task: Task, path: str) -> Result:
+    """Execute RESTCONF DELETE request"""
+    return _request(task, "DELETE", path)
 
-        resp.raise_for_status()
 
-        body = resp.json() if resp.content else {"status": "ok"}
-        logger.debug(f"[{task.host.name}] PUT successful")
+def restconf_close(task: Task) -> Result:
+    """Release the host's reference to its pooled client.
 
-        return Result(host=task.host, result=_pretty_json(body), changed=True)
+    The client itself is shared with every host on the same endpoint, so it stays
+    open for reuse and is closed by close_all_clients() at interpreter exit.
+    """
+    client = _get_store(task).pop("client", None)
+    if client is None:
+        logger.debug(f"[{task.host.name}] No client to close (never created)")
+        return Result(host=task.host, result="no client", changed=False)
+    return Result(host=task.host, result="released", changed=False)
 
-    except httpx.HTTPStatusError as e:
-        logger.error(
-            f"[{task.host.name}] HTTP error {e.response.status_code}: {e.response.text[:200]}"
-        )
-        return Result(
-            host=task.host,
-            failed=True,
-            result=f"PUT {url} -> {e.response.status_code} {e.response.text}",
-        )
-    except httpx.TimeoutException as e:
-        logger.error(f"[{task.host.name}] Request timeout: {e}")
-        return Result(host=task.host, failed=True, result=f"PUT {url} timed out: {e}")
-    except Exception as e:
-        logger.error(f"[{task.host.name}] Unexpected error: {type(e).__name__}: {e}")
-        logger.exception(f"[{task.host.name}] Full traceback:")
-        return Result(host=task.host, failed=True, result=f"PUT {url} failed: {e}")
 
+@atexit.register
+def close_all_clients() -> None:
+    """Close every shared sync client (registered with atexit)."""
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"Error closing httpx.Client at exit: {e}")
+        _CLIENTS.clear()
 
-def restconf_patch(task: Task, path: str, payload: dict[str, Any]) -> Result:
-    """Execute RESTCONF PATCH request"""
-    logger.debug(f"[{task.host.name}] Starting RESTCONF PATCH for path: {path}")
 
+# ---------------------------------------------------------------------------
+# Async variants
+#
+# Nornir runs each task on its own thread, so N hosts still cost one blocked
+# thread per RTT. These coroutines take a Host directly and are meant to be
+# driven from a single event loop with asyncio.gather (see run_httpx.py).
+# ---------------------------------------------------------------------------
+
+
+async def _get_async_client(host: Host) -> httpx.AsyncClient:
+    store = _get_host_store(host)
+    client = store.get("aclient")
+    if client is not None and not client.is_closed:
+        return client
+
+    cfg = _get_rc_config(host)
+    logger.debug(
+        "[{}] Creating new httpx.AsyncClient (HTTP/2) with base_url={}", host.name, cfg.base
+    )
+    client = httpx.AsyncClient(
+        base_url=cfg.base,
+        auth=cfg.auth,
+        headers=HEADERS,
+        verify=cfg.verify,
+        timeout=30.0,
+        http2=True,
+        limits=_LIMITS,
+    )
+    store["aclient"] = client
+    return client
+
+
+async def _arequest(
+    host: Host, method: str, path: str, payload: dict[str, Any] | None = None
+) -> Result:
+    """Shared request/response handling for the async RESTCONF verbs."""
     try:
-        client = _get_client(task)
+        client = await _get_async_client(host)
     except ValueError as e:
-        logger.error(f"[{task.host.name}] Failed to get client: {e}")
-        return Result(host=task.host, failed=True, result=str(e))
+        return Result(host=host, failed=True, result=str(e))
 
-    url = f"/data/{path.strip('/')}"
-    logger.debug(f"[{task.host.name}] Full URL: {client.base_url}{url}")
-    logger.debug(f"[{task.host.name}] Payload keys: {list(payload.keys())}")
+    url = _make_url(path)
+    logger.debug("[{}] {} {}{}", host.name, method, client.base_url, url)
 
     try:
-        logger.debug(f"[{task.host.name}] Sending PATCH request...")
-        resp = client.patch(url, json=payload)
-        logger.debug(f"[{task.host.name}] Response status: {resp.status_code}")
-
+        content = orjson.dumps(payload) if payload is not None else None
+        resp = await client.request(method, url, content=content)
+        logger.debug(
+            "[{}] Response status: {} ({})", host.name, resp.status_code, resp.http_version
+        )
         resp.raise_for_status()
 
-        body = resp.json() if resp.content else {"status": "ok"}
-        logger.debug(f"[{task.host.name}] PATCH successful")
+        if method == "DELETE":
+            return Result(host=host, result="deleted", changed=True)
+        if method == "GET":
+            return Result(host=host, result=_pretty_body(resp), changed=False)
 
-        return Result(host=task.host, result=_pretty_json(body), changed=True)
+        body = _decode_json(resp) if resp.content else {"status": "ok"}
+        return Result(host=host, result=_pretty_json(body), changed=True)
 
     except httpx.HTTPStatusError as e:
-        logger.error(
-            f"[{task.host.name}] HTTP error {e.response.status_code}: {e.response.text[:200]}"
-        )
+        logger.error(f"[{host.name}] HTTP error {e.response.status_code}: {e.response.text[:200]}")
         return Result(
-            host=task.host,
+            host=host,
             failed=True,
-            result=f"PATCH {url} -> {e.response.status_code} {e.response.text}",
+            result=f"{method} {url} -> {e.response.status_code} {e.response.text}",
         )
     except httpx.TimeoutException as e:
-        logger.error(f"[{task.host.name}] Request timeout: {e}")
-        return Result(host=task.host, failed=True, result=f"PATCH {url} timed out: {e}")
+        logger.error(f"[{host.name}] Request timeout: {e}")
+        return Result(host=host, failed=True, result=f"{method} {url} timed out: {e}")
     except Exception as e:
-        logger.error(f"[{task.host.name}] Unexpected error: {type(e).__name__}: {e}")
-        logger.exception(f"[{task.host.name}] Full traceback:")
-        return Result(host=task.host, failed=True, result=f"PATCH {url} failed: {e}")
+        logger.error(f"[{host.name}] Unexpected error: {type(e).__name__}: {e}")
+        logger.exception(f"[{host.name}] Full traceback:")
+        return Result(host=host, failed=True, result=f"{method} {url} failed: {e}")
 
 
-def restconf_delete(task: Task, path: str) -> Result:
-    """Execute RESTCONF DELETE request"""
-    logger.debug(f"[{task.host.name}] Starting RESTCONF DELETE for path: {path}")
+async def arestconf_get(host: Host, path: str) -> Result:
+    """Async RESTCONF GET"""
+    return await _arequest(host, "GET", path)
 
-    try:
-        client = _get_client(task)
-    except ValueError as e:
-        logger.error(f"[{task.host.name}] Failed to get client: {e}")
-        return Result(host=task.host, failed=True, result=str(e))
 
-    url = f"/data/{path.strip('/')}"
-    logger.debug(f"[{task.host.name}] Full URL: {client.base_url}{url}")
+async def arestconf_get_many(host: Host, paths: list[str]) -> list[Result]:
+    """Async RESTCONF GET of several paths at once, one Result per path in order.
 
-    try:
-        logger.debug(f"[{task.host.name}] Sending DELETE request...")
-        resp = client.delete(url)
-        logger.debug(f"[{task.host.name}] Response status: {resp.status_code}")
+    The host's AsyncClient speaks HTTP/2, so the GETs go out as concurrent streams
+    on one connection: total time is about the slowest response, not the sum.
+    """
+    return list(await asyncio.gather(*(_arequest(host, "GET", p) for p in paths)))
 
-        resp.raise_for_status()
-        logger.debug(f"[{task.host.name}] DELETE successful")
 
-        return Result(host=task.host, result="deleted", changed=True)
+async def arestconf_put(host: Host, path: str, payload: dict[str, Any]) -> Result:
+    """Async RESTCONF PUT"""
+    return await _arequest(host, "PUT", path, payload)
 
-    except httpx.HTTPStatusError as e:
-        logger.error(
-            f"[{task.host.name}] HTTP error {e.response.status_code}: {e.response.text[:200]}"
-        )
-        return Result(
-            host=task.host,
-            failed=True,
-            result=f"DELETE {url} -> {e.response.status_code} {e.response.text}",
-        )
-    except httpx.TimeoutException as e:
-        logger.error(f"[{task.host.name}] Request timeout: {e}")
-        return Result(host=task.host, failed=True, result=f"DELETE {url} timed out: {e}")
-    except Exception as e:
-        logger.error(f"[{task.host.name}] Unexpected error: {type(e).__name__}: {e}")
-        logger.exception(f"[{task.host.name}] Full traceback:")
-        return Result(host=task.host, failed=True, result=f"DELETE {url} failed: {e}")
 
+async def arestconf_patch(host: Host, path: str, payload: dict[str, Any]) -> Result:
+    """Async RESTCONF PATCH"""
+    return await _arequest(host, "PATCH", path, payload)
 
-def restconf_close(task: Task) -> Result:
-    """Idempotent: safe to call even if client never existed or already closed."""
-    logger.debug(f"[{task.host.name}] Attempting to close RESTCONF client")
 
-    store = _get_store(task)
-    client = store.get("client")
+async def arestconf_delete(host: Host, path: str) -> Result:
+    """Async RESTCONF DELETE"""
+    return await _arequest(host, "DELETE", path)
 
-    if client is None:
-        logger.debug(f"[{task.host.name}] No client to close (never created)")
-        return Result(host=task.host, result="no client", changed=False)
 
+async def arestconf_close(host: Host) -> Result:
+    """Idempotent: close the host's AsyncClient if one was created."""
+    store = _get_host_store(host)
+    client = store.pop("aclient", None)
+    if client is None:
+        return Result(host=host, result="no client", changed=False)
     try:
-        logger.debug(f"[{task.host.name}] Closing httpx.Client")
-        client.close()
-        logger.debug(f"[{task.host.name}] Client closed successfully")
+        await client.aclose()
     except Exception as e:
-        logger.warning(f"[{task.host.name}] Error during client close: {e}")
-    finally:
-        # Remove the reference from host.data
-        store.pop("client", None)
-        logger.debug(f"[{task.host.name}] Client reference removed from store")
-
-    return Result(host=task.host, result="closed", changed=False)
+        logger.warning(f"[{host.name}] Error during async client close: {e}")
+    return Result(host=host, result="closed", changed=False)
@@ -1,7 +1,9 @@
 import json
+import threading
 from typing import Any
 
 import httpx
+import orjson
 from nornir.core.task import Result, Task
 
 HEADERS = {
@@ -11,6 +13,12 @@ HEADERS = {
 
 _STORE_KEY = "_restconf_httpx"  # where we keep per-host client in host.data
 
+# One pooled HTTP/2 client per (base_url, username, password, verify), shared by
+# every host that points at the same endpoint
+_CLIENTS: dict[tuple, httpx.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+
 
 def _get_store(task: Task) -> dict[str, Any]:
     # Ensure a dedicated namespace in host.data
@@ -24,7 +32,7 @@ def _get_store(task: Task) -> dict[str, Any]:
 def _get_client(task: Task) -> httpx.Client:
     store = _get_store(task)
     client = store.get("client")
-    if client:
+    if client and not client.is_closed:
         return client
 
     rc: dict[str, Any] = task.host.data.get("restconf", {})
@@ -36,13 +44,31 @@ def _get_client(task: Task) -> httpx.Client:
     if not base or not user or not pwd:
         raise ValueError("Missing restconf.base_url/username/password in host data")
 
-    client = httpx.Client(
-        base_url=base.rstrip("/"), auth=(user, pwd), headers=HEADERS, verify=verify
-    )
+    key = (base.rstrip("/"), user, pwd, verify)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                base_url=key[0],
+                auth=(user, pwd),
+                headers=HEADERS,
+                verify=verify,
+                http2=True,
+                limits=_LIMITS,
+            )
+            _CLIENTS[key] = client
     store["client"] = client
     return client
 
 
+def close_all_clients() -> None:
+    """Close every shared client (call once after a fan-out run)."""
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+
+
 def _pretty_json(body: Any) -> str:
     try:
         return json.dumps(body, indent=2)
@@ -72,7 +98,7 @@ def restconf_put(task: Task, path: str, payload: dict[str, Any]) -> Result:
     client = _get_client(task)
     url = f"/data/{path.strip('/')}"
     try:
-        resp = client.put(url, json=payload)
+        resp = client.put(url, content=orjson.dumps(payload))
         resp.raise_for_status()
         body = resp.json() if resp.content else {"status": "ok"}
         return Result(host=task.host, result=_pretty_json(body), changed=True)
@@ -90,7 +116,7 @@ def restconf_patch(task: Task, path: str, payload: dict[str, Any]) -> Result:
     client = _get_client(task)
     url = f"/data/{path.strip('/')}"
     try:
-        resp = client.patch(url, json=payload)
+        resp = client.patch(url, content=orjson.dumps(payload))
         resp.raise_for_status()
         body = resp.json() if resp.content else {"status": "ok"}
         return Result(host=task.host, result=_pretty_json(body), changed=True)
@@ -122,7 +148,11 @@ def restconf_delete(task: Task, path: str) -> Result:
 
 
 def restconf_close(task: Task) -> Result:
-    """Idempotent: safe to call even if client never existed or already closed."""
+    """Idempotent: safe to call even if client never existed or already closed.
+
+    Clients are shared per endpoint, so this also closes them for other hosts
+    on the same base_url; the next call on any of them opens a fresh one.
+    """
     store = _get_store(task)
     client = store.get("client")
     if client is None:
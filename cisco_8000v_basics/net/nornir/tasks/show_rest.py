@@ -1,13 +1,36 @@
-import json
+import threading
 
+import orjson
 import requests
 from nornir.core.task import Result, Task
+from requests.adapters import HTTPAdapter
 
 HEADERS = {
     "Accept": "application/yang-data+json",
     "Content-Type": "application/yang-data+json",
 }
 
+# Keep-alive sessions per (base_url, verify) so repeat GETs skip the TLS handshake
+_SESSIONS: dict[tuple[str, bool], requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(base: str, verify: bool) -> requests.Session:
+    key = (base, verify)
+    sess = _SESSIONS.get(key)
+    if sess is None:
+        with _SESSIONS_LOCK:
+            sess = _SESSIONS.get(key)
+            if sess is None:
+                sess = requests.Session()
+                sess.headers.update(HEADERS)
+                sess.verify = verify
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+                sess.mount("https://", adapter)
+                sess.mount("http://", adapter)
+                _SESSIONS[key] = sess
+    return sess
+
 
 def restconf_get(task: Task, path: str) -> Result:
     rc = task.host.get("restconf", None) or task.host.data.get("restconf", {})
@@ -23,17 +46,19 @@ def restconf_get(task: Task, path: str) -> Result:
         )
 
     url = f"{base}/data/{path.strip('/')}"
-    resp = requests.get(url, headers=HEADERS, auth=(user, pwd), verify=verify, timeout=30)
+    resp = _get_session(base, verify).get(url, auth=(user, pwd), timeout=30)
     if not resp.ok:
         return Result(
             host=task.host, failed=True, result=f"GET {url} -> {resp.status_code} {resp.text}"
         )
 
-    # pretty JSON string for console, raw data in result
+    # pretty JSON string for console; the decoded tree is only a temporary so
+    # large bodies never hold both the object tree and the string at once
     try:
-        payload = resp.json()
-        pretty = json.dumps(payload, indent=2)
-    except Exception:
-        payload, pretty = resp.text, resp.text
+        pretty = orjson.dumps(
+            orjson.loads(resp.content), option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        ).decode()
+    except orjson.JSONDecodeError:
+        pretty = resp.text
 
     return Result(host=task.host, result=pretty, changed=False)
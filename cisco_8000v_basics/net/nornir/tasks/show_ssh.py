@@ -1,21 +1,22 @@
-import re
-
 from nornir.core.task import Result, Task
 from nornir_netmiko.tasks import netmiko_send_command
 
+# Plain literals: substring search beats the regex engine on long outputs
+_ERRORS = ("Error:", "Invalid parameter", "Invalid syntax", "Command not found")
+
 
 def show_router_interface(task: Task, cmd: str = "show ip interface brief") -> Result:
     # Normalize to classic CLI and disable pager
     r = task.run(netmiko_send_command, command_string=cmd)
 
     # Simple error scan
-    for pat in (r"Error:", r"Invalid parameter", r"Invalid syntax", r"Command not found"):
-        if re.search(pat, r.result):
-            return Result(
-                host=task.host,
-                result=f"FAILED ({pat}):\n{r.result}",
-                failed=True,
-                changed=False,
-                name=cmd,
-            )
+    hit = next((e for e in _ERRORS if e in r.result), None)
+    if hit:
+        return Result(
+            host=task.host,
+            result=f"FAILED ({hit}):\n{r.result}",
+            failed=True,
+            changed=False,
+            name=cmd,
+        )
     return Result(host=task.host, result=r.result, changed=False, name=cmd)
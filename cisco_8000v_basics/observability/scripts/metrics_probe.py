@@ -1,26 +1,84 @@
+import asyncio
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
+from icmplib import ICMPLibError, ICMPv4Socket, SocketPermissionError, multiping
+from icmplib import ping as icmp_ping
 from loguru import logger
 
 
-def ping(host: str, count: int = 3) -> float | None:
+@cache
+def _icmp_privileged() -> bool | None:
+    """Socket mode icmplib can use here: False (unprivileged), True (raw), None (neither).
+
+    Unprivileged ICMP needs net.ipv4.ping_group_range to cover our group; raw
+    sockets need root / CAP_NET_RAW. With neither, probes fall back to /bin/ping.
+    """
+    for privileged in (False, True):
+        try:
+            ICMPv4Socket(privileged=privileged).close()
+            return privileged
+        except SocketPermissionError:
+            continue
+    logger.warning("ICMP sockets not permitted, falling back to the ping binary")
+    return None
+
+
+def _subprocess_ping(host: str, count: int = 3) -> float | None:
     try:
-        out = subprocess.check_output(["ping", "-c", str(count), host], text=True)
-        # naive parse
+        out = subprocess.check_output(["ping", "-c", str(count), "-W", "2", host], text=True)
         for line in out.splitlines():
-            if "avg" in line or "rtt min/avg/max" in line:
-                parts = line.split("=")[-1].split("/")
-                return float(parts[1])
-    except Exception as e:
+            if "min/avg/max" in line:
+                return float(line.split("=")[-1].split("/")[1])
+    except (OSError, subprocess.CalledProcessError, ValueError, IndexError) as e:
         logger.error(f"ping failed: {e}")
     return None
 
 
-if __name__ == "__main__":
-    host = sys.argv[1] if len(sys.argv) > 1 else "8.8.8.8"
+def ping(host: str, count: int = 3) -> float | None:
+    privileged = _icmp_privileged()
+    if privileged is None:
+        return _subprocess_ping(host, count)
+    try:
+        result = icmp_ping(host, count=count, interval=0.2, timeout=2, privileged=privileged)
+        if result.is_alive:
+            return result.avg_rtt
+    except ICMPLibError as e:
+        logger.error(f"ping failed: {e}")
+    return None
+
+
+def ping_many(hosts: list[str], count: int = 3) -> dict[str, float | None]:
+    """Probe every host concurrently; results keyed by the name given, None if unreachable."""
+    privileged = _icmp_privileged()
+    if privileged is None:
+        with ThreadPoolExecutor(max_workers=min(32, len(hosts) or 1)) as pool:
+            return dict(zip(hosts, pool.map(_subprocess_ping, hosts, [count] * len(hosts))))
+    try:
+        results = multiping(hosts, count=count, interval=0.2, timeout=2, privileged=privileged)
+    except ICMPLibError as e:
+        logger.error(f"ping failed: {e}")
+        return dict.fromkeys(hosts)
+    # multiping keeps input order; r.address is the resolved IP, not the caller's name
+    return {h: r.avg_rtt if r.is_alive else None for h, r in zip(hosts, results)}
+
+
+async def run_forever(hosts: list[str], interval: float = 30.0) -> None:
+    """Probe `hosts` every `interval` seconds on a fixed monotonic schedule.
+
+    Ticks are anchored to the start time rather than to the end of the previous
+    probe, so the few seconds a probe takes don't accumulate as drift.
+    """
+    next_t = time.monotonic()
     while True:
-        rtt = ping(host) or -1.0
-        logger.info(f"{host} avg_rtt_ms={rtt}")
-        time.sleep(30)
+        for host, rtt in (await asyncio.to_thread(ping_many, hosts)).items():
+            logger.info(f"{host} avg_rtt_ms={rtt if rtt is not None else -1.0}")
+        next_t += interval
+        await asyncio.sleep(max(0.0, next_t - time.monotonic()))
+
+
+if __name__ == "__main__":
+    asyncio.run(run_forever(sys.argv[1:] or ["8.8.8.8"]))
@@ -8,21 +8,10 @@ from pathlib import Path
 import pytest
 from nornir import InitNornir
 
-# Calculate project root correctly
-# This file is at: validation/tests/conftest.py
-# Project root is 2 levels up: ../../
-project_root = Path(__file__).parent.parent.parent
+# Project root: this file is at cisco_8000v_basics/tests/conftest.py
+project_root = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(project_root))
 
-print(f"DEBUG: conftest.py location: {Path(__file__)}")
-print(f"DEBUG: Project root: {project_root}")
-print(f"DEBUG: Project root exists: {project_root.exists()}")
-
-# Verify the config file path
-config_path = project_root / "net" / "nornir" / "config.yaml"
-print(f"DEBUG: Config path: {config_path}")
-print(f"DEBUG: Config exists: {config_path.exists()}")
-
 
 @pytest.fixture(scope="session")
 def project_root_path():
@@ -30,13 +19,17 @@ def project_root_path():
     return project_root
 
 
-@pytest.fixture(scope="function")
-def nornir_instance(project_root_path):
-    """Reusable Nornir instance for all tests in a module."""
-    from cisco_8000v_basics.net.nornir.tasks.show_httpx import restconf_close
+@pytest.fixture(scope="session")
+def _nornir_session(project_root_path):
+    """Nornir instance shared by every test in the session.
+
+    Inventory is parsed once and the warmed RESTCONF clients stay open across
+    tests, so timings measure steady-state requests rather than cold TLS setup.
+    """
+    from cisco_8000v_basics.net.nornir.tasks.show_httpx import restconf_close, warm_clients
 
     # Define paths relative to project root
-    nornir_dir = project_root_path / "net" / "nornir"
+    nornir_dir = project_root_path / "cisco_8000v_basics" / "net" / "nornir"
     config_file = nornir_dir / "config.yaml"
     inventory_dir = nornir_dir / "inventory"
 
@@ -60,7 +53,39 @@ def nornir_instance(project_root_path):
         logging={"enabled": False},
     )
 
+    # Handshake with every host up front so per-test timings exclude TLS setup
+    warmed = warm_clients(nr.inventory.hosts.values())
+    if all(r.failed for r in warmed.values()):
+        nr.run(task=restconf_close)
+        pytest.skip("No RESTCONF host reachable - skipping sandbox tests")
+
     yield nr
 
-    # Cleanup after all tests
+    # Cleanup once, after the last test
     nr.run(task=restconf_close)
+
+
+@pytest.fixture
+def nornir_instance(_nornir_session):
+    """Session Nornir with failed hosts reset before each test.
+
+    Nornir skips hosts that failed an earlier task ("0 hosts selected"), so without
+    this one test's failure would cascade into every later test.
+    """
+    _nornir_session.data.reset_failed_hosts()
+    return _nornir_session
+
+
+@pytest.fixture(scope="session")
+def run_async():
+    """Run an async RESTCONF task (arestconf_*) on hosts concurrently on one event loop.
+
+    Usage: run_async(arestconf_get, flt.inventory.hosts.values(), path=...)
+    Returns {host_name: Result}; uses uvloop when installed.
+    """
+    from cisco_8000v_basics.net.nornir.run_httpx import _run_async
+
+    def _run(task_fn, hosts, path):
+        return _run_async(task_fn, list(hosts), path)
+
+    return _run
@@ -3,12 +3,16 @@ Network validation tests using RESTCONF.
 These tests verify connectivity and data retrieval from network devices.
 """
 
-import json
-
+import orjson
 import pytest
 from nornir.core.filter import F
 
-from cisco_8000v_basics.net.nornir.tasks.show_httpx import restconf_get
+from cisco_8000v_basics.net.nornir.tasks.show_httpx import (
+    arestconf_close,
+    arestconf_get,
+    arestconf_get_many,
+    restconf_get,
+)
 
 
 def test_project_structure(project_root_path):
@@ -33,7 +37,7 @@ def test_interfaces_present_and_named(nornir_instance):
     assert flt.inventory.hosts, "No host matched filter 'cisco_8k-xe'"
 
     # Execute RESTCONF GET
-    res = flt.run(task=restconf_get, path="ietf-interfaces:interfaces")
+    res = flt.run(task=restconf_get, path="ietf-interfaces:interfaces", raw=True)
 
     # Ensure task succeeded
     for host, multi_result in res.items():
@@ -41,7 +45,7 @@ def test_interfaces_present_and_named(nornir_instance):
 
     # Parse JSON response
     out = next(iter(res.values()))[0].result
-    data = json.loads(out)
+    data = orjson.loads(out)
 
     # Validate structure
     ifaces = data.get("ietf-interfaces:interfaces", {}).get("interface", [])
@@ -61,10 +65,10 @@ def test_interface_operational_data(nornir_instance):
     flt = nornir_instance.filter(F(name="cisco_8k-xe"))
     assert flt.inventory.hosts, "No host matched"
 
-    res = flt.run(task=restconf_get, path="openconfig-interfaces:interfaces")
+    res = flt.run(task=restconf_get, path="openconfig-interfaces:interfaces", raw=True)
 
     out = next(iter(res.values()))[0].result
-    data = json.loads(out)
+    data = orjson.loads(out)
     ifaces = data.get("openconfig-interfaces:interfaces", {}).get("interface", [])
 
     # At least one interface should be operational
@@ -118,17 +122,20 @@ def test_client_reuse(nornir_instance):
 
 @pytest.mark.devnet_sandbox
 @pytest.mark.integration
-def test_response_time_reasonable(nornir_instance):
+def test_response_time_reasonable(nornir_instance, run_async):
     """Basic performance check - RESTCONF should respond within reasonable time."""
     import time
 
     flt = nornir_instance.filter(F(name="cisco_8k-xe"))
 
+    # Async GET on one event loop (uvloop when installed) - no per-host worker thread
     start = time.time()
-    res = flt.run(task=restconf_get, path="openconfig-interfaces:interfaces")
+    res = run_async(
+        arestconf_get, flt.inventory.hosts.values(), path="openconfig-interfaces:interfaces"
+    )
     elapsed = time.time() - start
 
-    assert not res.failed, "Task failed"
+    assert not any(r.failed for r in res.values()), "Task failed"
     assert elapsed < 10.0, f"Request took {elapsed:.2f}s - exceeds 10s threshold"
 
     print(f"✓ Response time: {elapsed:.2f}s")
@@ -141,8 +148,8 @@ def test_pre_post_validation_pattern(nornir_instance):
     flt = nornir_instance.filter(F(name="cisco_8k-xe"))
 
     # PRE-CHECK: Get baseline state
-    pre = flt.run(task=restconf_get, path="openconfig-interfaces:interfaces")
-    pre_data = json.loads(next(iter(pre.values()))[0].result)
+    pre = flt.run(task=restconf_get, path="openconfig-interfaces:interfaces", raw=True)
+    pre_data = orjson.loads(next(iter(pre.values()))[0].result)
     pre_ifaces = pre_data.get("openconfig-interfaces:interfaces", {}).get("interface", [])
     pre_count = len(pre_ifaces)
 
@@ -150,8 +157,8 @@ def test_pre_post_validation_pattern(nornir_instance):
     # In real scenario: flt.run(task=restconf_patch, path=..., payload=...)
 
     # POST-CHECK: Verify state after change
-    post = flt.run(task=restconf_get, path="openconfig-interfaces:interfaces")
-    post_data = json.loads(next(iter(post.values()))[0].result)
+    post = flt.run(task=restconf_get, path="openconfig-interfaces:interfaces", raw=True)
+    post_data = orjson.loads(next(iter(post.values()))[0].result)
     post_ifaces = post_data.get("openconfig-interfaces:interfaces", {}).get("interface", [])
     post_count = len(post_ifaces)
 
@@ -161,5 +168,30 @@ def test_pre_post_validation_pattern(nornir_instance):
     print(f"✓ Pre/post validation pattern working (verified {pre_count} interfaces)")
 
 
+@pytest.mark.devnet_sandbox
+@pytest.mark.integration
+def test_get_many_multiplexed(nornir_instance):
+    """Several paths on one host come back together over one HTTP/2 connection."""
+    import asyncio
+
+    host = nornir_instance.inventory.hosts["cisco_8k-xe"]
+    paths = ["openconfig-interfaces:interfaces", "ietf-interfaces:interfaces"]
+
+    async def _get_many():
+        try:
+            return await arestconf_get_many(host, paths)
+        finally:
+            await arestconf_close(host)
+
+    results = asyncio.run(_get_many())
+
+    assert len(results) == len(paths)
+    for path, result in zip(paths, results):
+        assert not result.failed, f"GET {path} failed: {result.result}"
+        assert path in orjson.loads(result.result), f"Missing top-level key for {path}"
+
+    print(f"✓ Fetched {len(paths)} paths concurrently")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,54 @@
+"""Tests for nested dict/list traversal helpers."""
+
+import pytest
+
+from cisco_8000v_basics.automation.lib.nested import get_nested, get_nested_many
+
+CONFIG = {
+    "interface": {
+        "Loopback": [
+            {
+                "name": 100,
+                "description": "mgmt",
+                "ip": {"address": {"primary": {"address": "10.0.0.1", "mask": "255.255.255.255"}}},
+            }
+        ]
+    }
+}
+
+
+def test_get_nested_hit():
+    """Test dict keys and list indexes resolve."""
+    assert get_nested(CONFIG, "interface", "Loopback", 0, "name") == 100
+
+
+def test_get_nested_miss_returns_default():
+    """Test misses and type mismatches return default when not strict."""
+    assert get_nested(CONFIG, "interface", "Vlan") is None
+    assert get_nested(CONFIG, "interface", "Loopback", 5, default="x") == "x"
+    assert get_nested(CONFIG, "interface", 0, default="x") == "x"
+
+
+def test_get_nested_strict_raises():
+    """Test strict mode raises on misses."""
+    with pytest.raises(KeyError):
+        get_nested(CONFIG, "missing", strict=True)
+    with pytest.raises(IndexError):
+        get_nested(CONFIG, "interface", "Loopback", 5, strict=True)
+    with pytest.raises(TypeError):
+        get_nested(CONFIG, "interface", "Loopback", "name", strict=True)
+
+
+def test_get_nested_many_matches_get_nested():
+    """Test batch lookup agrees with per-path lookup, including misses and shared prefixes."""
+    lb = ("interface", "Loopback", 0)
+    paths = [
+        (*lb, "ip", "address", "primary", "address"),
+        (*lb, "ip", "address", "primary", "mask"),
+        (*lb, "description"),
+        (*lb, "ip", "address", "secondary"),
+        ("interface", "Loopback", 3, "name"),
+        ("interface",),
+    ]
+    got = get_nested_many(CONFIG, paths, default="-")
+    assert got == {p: get_nested(CONFIG, *p, default="-") for p in paths}
@@ -96,7 +96,7 @@ class IntentEngine:
                     "description": lb.get("description"),
                 }
 
-                logger.debug(f"Found Loopback{lb_id}: {loopbacks[lb_id]}")
+                logger.debug("Found Loopback{}: {}", lb_id, loopbacks[str(lb_id)])
 
         except (KeyError, TypeError) as e:
             logger.error(f"Error parsing loopback config from {device_name}: {e}")
@@ -267,6 +267,29 @@ class IntentEngine:
 
         return False
 
+    def apply_loopback_changes(self, device_name: str, changes: list[Change]) -> bool:
+        """
+        Apply all loopback creates/updates for one device as a single transaction.
+
+        Args:
+            device_name: Target device
+            changes: create/update loopback changes for that device
+
+        Returns:
+            True if the batch was committed
+        """
+        logger.info(f"Applying {len(changes)} loopback changes to {device_name} in one transaction")
+        specs = [
+            (
+                c.resource_id,
+                c.desired["ip"],
+                c.desired["netmask"],
+                c.desired.get("description"),
+            )
+            for c in changes
+        ]
+        return bool(self.client.configure_loopbacks(device_name, specs))
+
     def apply_intent(self, intent: NetworkIntent, dry_run: bool = False) -> tuple[int, int]:
         """
         Apply network intent - reconcile desired state with actual state.
@@ -307,7 +330,33 @@ class IntentEngine:
         success_count = 0
         failure_count = 0
 
+        # Loopback creates/updates are pushed per device in one PATCH (one NSO commit);
+        # deletes and dry-run previews still go change by change
+        batches: dict[str, list[Change]] = {}
+        singles: list[Change] = []
         for change in changes:
+            if (
+                not dry_run
+                and change.resource_type == "loopback"
+                and change.action in ("create", "update")
+            ):
+                batches.setdefault(change.device, []).append(change)
+            else:
+                singles.append(change)
+
+        for device_name, batch in batches.items():
+            try:
+                if self.apply_loopback_changes(device_name, batch):
+                    success_count += len(batch)
+                else:
+                    failure_count += len(batch)
+                    for change in batch:
+                        logger.error(f"✗ Failed to apply: {change}")
+            except Exception as e:
+                failure_count += len(batch)
+                logger.error(f"✗ Exception applying loopback batch on {device_name}: {e}")
+
+        for change in singles:
             try:
                 if self.apply_change(change, dry_run=dry_run):
                     success_count += 1
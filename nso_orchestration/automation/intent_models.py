@@ -5,18 +5,48 @@ These models define the desired state of the network and validate
 configuration before it's pushed to devices.
 """
 
-from typing import Literal
-
-from pydantic import BaseModel, Field, field_validator
+import socket
+from collections import Counter
+from pathlib import Path
+from typing import Any, Literal
+
+import yaml
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+
+try:  # libyaml bindings, when PyYAML was built with them
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
+# Strict dotted-quad (each octet 0-255). Kept as a plain string so pydantic-core
+# compiles it with its Rust regex engine; [0-9] rather than \d, which is
+# Unicode-aware there.
+_OCTET = r"(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+IPV4_PATTERN = rf"^(?:{_OCTET}\.){{3}}{_OCTET}$"
+
+# XML-significant characters rejected in descriptions (payloads are rendered into XML)
+_INVALID_DESC_CHARS = ["<", ">", "&", '"', "'"]
+_BAD_DESC_CHARS = str.maketrans("", "", "".join(_INVALID_DESC_CHARS))
+
+# Intents are immutable snapshots of desired state; unknown keys are typos, not data
+INTENT_CONFIG = ConfigDict(frozen=True, extra="forbid")
 
 
 class LoopbackIntent(BaseModel):
     """Intent model for a loopback interface."""
 
+    model_config = INTENT_CONFIG
+
     id: int = Field(..., ge=0, le=2147483647, description="Loopback interface number")
-    ipv4: str = Field(
-        ..., pattern=r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$", description="IPv4 address"
-    )
+    ipv4: str = Field(..., pattern=IPV4_PATTERN, description="IPv4 address")
     netmask: str = Field(..., description="Subnet mask")
     description: str | None = Field(None, max_length=240, description="Interface description")
 
@@ -24,42 +54,16 @@ class LoopbackIntent(BaseModel):
     @classmethod
     def validate_netmask(cls, v: str) -> str:
         """Validate subnet mask format."""
-        valid_masks = {
-            "255.255.255.255",
-            "255.255.255.254",
-            "255.255.255.252",
-            "255.255.255.248",
-            "255.255.255.240",
-            "255.255.255.224",
-            "255.255.255.192",
-            "255.255.255.128",
-            "255.255.255.0",
-            "255.255.254.0",
-            "255.255.252.0",
-            "255.255.248.0",
-            "255.255.240.0",
-            "255.255.224.0",
-            "255.255.192.0",
-            "255.255.128.0",
-            "255.255.0.0",
-            "255.254.0.0",
-            "255.252.0.0",
-            "255.248.0.0",
-            "255.240.0.0",
-            "255.224.0.0",
-            "255.192.0.0",
-            "255.128.0.0",
-            "255.0.0.0",
-            "254.0.0.0",
-            "252.0.0.0",
-            "248.0.0.0",
-            "240.0.0.0",
-            "224.0.0.0",
-            "192.0.0.0",
-            "128.0.0.0",
-            "0.0.0.0",
-        }
-        if v not in valid_masks:
+        try:
+            packed = socket.inet_aton(v)
+        except OSError:
+            packed = None
+        # inet_aton also takes short/hex forms ("255.0", "0xff..."): require canonical dotted-quad
+        if packed is None or socket.inet_ntoa(packed) != v:
+            raise ValueError(f"Invalid subnet mask: {v}. Must be a valid dotted-decimal mask.")
+        # Contiguous mask <=> inverted mask is 2**k - 1 (no bit set above a zero bit)
+        inv = ~int.from_bytes(packed, "big") & 0xFFFFFFFF
+        if inv & (inv + 1):
             raise ValueError(f"Invalid subnet mask: {v}. Must be a valid dotted-decimal mask.")
         return v
 
@@ -70,26 +74,17 @@ class LoopbackIntent(BaseModel):
         if v is None:
             return v
 
-        invalid_chars = ["<", ">", "&", '"', "'"]
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"Description contains invalid characters: {invalid_chars}")
+        # translate() deletes the bad chars in one C loop; a shorter result means a hit
+        if len(v.translate(_BAD_DESC_CHARS)) != len(v):
+            raise ValueError(f"Description contains invalid characters: {_INVALID_DESC_CHARS}")
 
         return v
 
     @field_validator("ipv4")
     @classmethod
     def validate_ipv4(cls, v: str) -> str:
-        """Validate IPv4 address format and ranges."""
-        octets = v.split(".")
-
-        # Check each octet is 0-255
-        for octet in octets:
-            num = int(octet)
-            if not 0 <= num <= 255:
-                raise ValueError(f"Invalid IPv4 address: {v}. Octets must be 0-255.")
-
-        # Warn about reserved ranges (but don't reject)
-        first_octet = int(octets[0])
+        """Reject reserved first octets (format and 0-255 ranges are enforced by the pattern)."""
+        first_octet = int(v[: v.index(".")])
         if first_octet == 0:
             raise ValueError("IPv4 address cannot start with 0 (reserved)")
         if first_octet >= 224:
@@ -101,6 +96,8 @@ class LoopbackIntent(BaseModel):
 class BGPNeighborIntent(BaseModel):
     """Intent model for a BGP neighbor."""
 
+    model_config = INTENT_CONFIG
+
     ip: str = Field(..., description="Neighbor IP address")
     remote_asn: int = Field(..., ge=1, le=4294967295, description="Remote AS number")
     description: str | None = Field(None, max_length=80)
@@ -110,14 +107,25 @@ class BGPNeighborIntent(BaseModel):
 class BGPIntent(BaseModel):
     """Intent model for BGP configuration."""
 
+    model_config = INTENT_CONFIG
+
     asn: int = Field(..., ge=1, le=4294967295, description="Local AS number")
     router_id: str | None = Field(None, description="BGP router ID")
     neighbors: list[BGPNeighborIntent] = Field(default_factory=list)
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "BGPIntent":
+        """Build from already-validated data without re-running validation."""
+        fields = {k: v for k, v in data.items() if k != "neighbors"}
+        neighbors = [BGPNeighborIntent.model_construct(**n) for n in data.get("neighbors", [])]
+        return cls.model_construct(neighbors=neighbors, **fields)
+
 
 class DeviceIntent(BaseModel):
     """Intent model for a network device."""
 
+    model_config = INTENT_CONFIG
+
     name: str = Field(..., min_length=1, max_length=63, description="Device hostname")
     device_type: Literal["ios", "ios-xe", "ios-xr", "nxos"] = Field(
         ..., description="Device OS type"
@@ -145,69 +153,85 @@ class DeviceIntent(BaseModel):
             )
         return v
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "DeviceIntent":
+        """
+        Build from already-validated data without re-running validation.
+
+        For trusted round-trips only (a model_dump() of a validated intent, or
+        data read back from NSO's CDB). User-supplied YAML/JSON must still go
+        through model_validate.
+        """
+        fields = {k: v for k, v in data.items() if k not in ("loopbacks", "bgp")}
+        loopbacks = [LoopbackIntent.model_construct(**lb) for lb in data.get("loopbacks", [])]
+        bgp = BGPIntent.from_trusted(data["bgp"]) if data.get("bgp") else None
+        return cls.model_construct(loopbacks=loopbacks, bgp=bgp, **fields)
+
 
 class NetworkIntent(BaseModel):
     """Full network intent - the source of truth."""
 
+    model_config = INTENT_CONFIG
+
     devices: list[DeviceIntent] = Field(..., min_length=1)
 
-    @field_validator("devices")
+    # name -> device, built by the validator / from_trusted (not a field, not serialized).
+    # model_copy() carries private attrs over, so the index remembers which devices list
+    # it was built from and get_device rebuilds it when `devices` has been replaced.
+    _device_index: dict[str, DeviceIntent] | None = PrivateAttr(default=None)
+    _indexed_devices: list[DeviceIntent] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def validate_unique_devices(self) -> "NetworkIntent":
+        """Ensure device names are unique; the name index doubles as get_device's lookup."""
+        index = {d.name: d for d in self.devices}
+        if len(index) != len(self.devices):
+            counts = Counter(d.name for d in self.devices)
+            duplicates = ", ".join(name for name, n in counts.items() if n > 1)
+            raise ValueError(f"Duplicate device names found: {duplicates}")
+        self._device_index = index
+        self._indexed_devices = self.devices
+        return self
+
     @classmethod
-    def validate_unique_devices(cls, v: list[DeviceIntent]) -> list[DeviceIntent]:
-        """Ensure device names are unique."""
-        names = [d.name for d in v]
-        if len(names) != len(set(names)):
-            duplicates = [name for name in names if names.count(name) > 1]
-            raise ValueError(f"Duplicate device names found: {set(duplicates)}")
-        return v
+    def from_trusted(cls, data: dict[str, Any]) -> "NetworkIntent":
+        """Build from already-validated data without re-running validation."""
+        intent = cls.model_construct(
+            devices=[DeviceIntent.from_trusted(d) for d in data.get("devices", [])]
+        )
+        intent._device_index = {d.name: d for d in intent.devices}
+        intent._indexed_devices = intent.devices
+        return intent
+
+    @classmethod
+    def load(cls, path: str | Path) -> "NetworkIntent":
+        """
+        Load and validate an intent file.
+
+        .json files go straight to pydantic-core (model_validate_json), which
+        parses the bytes into the schema without an intermediate dict; anything
+        else is read as YAML (libyaml's CSafeLoader when available).
+        """
+        path = Path(path)
+        data = path.read_bytes()
+        if path.suffix == ".json":
+            return cls.model_validate_json(data)
+        return cls.model_validate(yaml.load(data, Loader=_YamlLoader))
 
     def get_device(self, name: str) -> DeviceIntent | None:
-        """Get device intent by name."""
-        for device in self.devices:
-            if device.name == name:
-                return device
-        return None
-
-
-# Example usage and validation
-if __name__ == "__main__":
-    import json
-
-    # Example intent
-    intent_data = {
-        "devices": [
-            {
-                "name": "dist-rtr01",
-                "device_type": "ios-xe",
-                "loopbacks": [
-                    {
-                        "id": 100,
-                        "ipv4": "10.100.100.1",
-                        "netmask": "255.255.255.255",
-                        "description": "Management loopback",
-                    },
-                    {
-                        "id": 200,
-                        "ipv4": "10.200.200.1",
-                        "netmask": "255.255.255.255",
-                        "description": "BGP peering",
-                    },
-                ],
-                "bgp": {
-                    "asn": 65001,
-                    "router_id": "10.100.100.1",
-                    "neighbors": [
-                        {"ip": "10.0.0.2", "remote_asn": 65002, "description": "Core router"}
-                    ],
-                },
-            }
-        ]
-    }
-
-    # Validate
-    try:
-        intent = NetworkIntent(**intent_data)
-        print("✓ Intent validation passed!")
-        print(json.dumps(intent.model_dump(), indent=2))
-    except Exception as e:
-        print(f"✗ Intent validation failed: {e}")
+        """Get device intent by name (O(1); the index is built at validation)."""
+        if self._device_index is None or self._indexed_devices is not self.devices:
+            self._device_index = {d.name: d for d in self.devices}
+            self._indexed_devices = self.devices
+        return self._device_index.get(name)
+
+
+# Built once at import; rebuilding a TypeAdapter per call recompiles its validator
+_DEVICES_ADAPTER: TypeAdapter[list[DeviceIntent]] = TypeAdapter(list[DeviceIntent])
+
+
+def load_devices(data: bytes | str | list[dict[str, Any]]) -> list[DeviceIntent]:
+    """Validate a bare device list (JSON bytes/str or already-parsed list) without a NetworkIntent."""
+    if isinstance(data, bytes | str):
+        return _DEVICES_ADAPTER.validate_json(data)
+    return _DEVICES_ADAPTER.validate_python(data)
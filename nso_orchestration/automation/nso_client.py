@@ -9,14 +9,123 @@ This module provides a clean interface to Cisco NSO's RESTCONF API with:
 - Built on httpx for modern HTTP/2 support and type safety
 """
 
+import asyncio
+import random
+import threading
+import time
+from functools import lru_cache
 from typing import Any
+from urllib.parse import quote
 
 import httpx
-import urllib3
+import ijson
+import orjson
 from loguru import logger
 
-# Suppress SSL warnings for sandbox environments
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+_warnings_disabled = False
+
+
+def _disable_insecure_warnings() -> None:
+    """Suppress urllib3's InsecureRequestWarning once (sandbox certs aren't verified)."""
+    global _warnings_disabled
+    if _warnings_disabled:
+        return
+    import urllib3  # deferred: only clients with verify_ssl=False need it
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    _warnings_disabled = True
+
+
+# Compact XML bodies (no indentation shipped on the wire), formatted per call
+_LOOPBACK_XML = (
+    "<Loopback><name>{name}</name>{desc}"
+    "<ip><address><primary><address>{ip}</address><mask>{mask}</mask></primary></address></ip>"
+    "</Loopback>"
+)
+_DESC_XML = "<description>{}</description>"
+_INTERFACE_XML = '<interface xmlns="urn:ios">{}</interface>'
+_ROLLBACK_XML = '<input xmlns="http://tail-f.com/ns/rollback"><{tag}>{value}</{tag}></input>'
+# Body of parameterless actions (sync-from), serialized once
+_EMPTY_INPUT = b'{"input":{}}'
+
+# Transient failures retried in-client (connect errors are retried by the transport).
+# POST is left out: creates and RPCs aren't safe to replay after a lost response
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "PATCH", "DELETE"})
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 2.0
+
+# Process-wide clients handed out by NSOClient.shared(), keyed by every setting that
+# changes who we talk to and how: (host, port, username, password, use_https, verify_ssl)
+_SHARED_CLIENTS: dict[tuple[str, int, str, str, bool, bool], "NSOClient"] = {}
+_SHARED_LOCK = threading.Lock()
+
+# RESTCONF fields= selector for interface reads: just what callers check (existence,
+# primary IP, description) instead of the whole subtree (QoS, ACLs, policies...)
+INTERFACE_FIELDS = "name;ip/address/primary(address;mask);description"
+
+
+@lru_cache(maxsize=1024)
+def _device_url(base_url: str, device_name: str) -> str:
+    """RESTCONF URL of one NSO device entry, with the key percent-encoded once per device."""
+    return f"{base_url}/data/tailf-ncs:devices/device={quote(device_name, safe='')}"
+
+
+@lru_cache(maxsize=1024)
+def _iface_url(base_url: str, device_name: str) -> str:
+    """URL of a device's tailf-ned-cisco-ios:interface container (loopback reads/writes)."""
+    return f"{_device_url(base_url, device_name)}/config/tailf-ned-cisco-ios:interface"
+
+
+def _device_config_url(base_url: str, device_name: str, subtree: str | None = None) -> str:
+    """RESTCONF URL for a device's /config, or a subtree under it."""
+    url = f"{_device_url(base_url, device_name)}/config"
+    return f"{url}/{subtree}" if subtree else url
+
+
+def _depth_params(depth: int | None) -> httpx.QueryParams | None:
+    """depth= query so NSO stops serializing below that many levels (None: full tree)."""
+    return httpx.QueryParams(depth=depth) if depth is not None else None
+
+
+def _loopback_xml(
+    loopback_id: str, ip_address: str, netmask: str, description: str | None = None
+) -> str:
+    """XML body for a Loopback list entry under tailf-ned-cisco-ios:interface."""
+    return _LOOPBACK_XML.format_map(
+        {
+            "name": loopback_id,
+            "desc": _DESC_XML.format(description) if description else "",
+            "ip": ip_address,
+            "mask": netmask,
+        }
+    )
+
+
+def _loopback_post_result(
+    resp: httpx.Response | None, loopback_id: str, dry_run: bool
+) -> bool | dict[str, Any]:
+    """Interpret a configure-loopback POST response (True, dry-run diff, or False)."""
+    if not resp:
+        logger.error(f"✗ Failed to configure Loopback{loopback_id}")
+        return False
+
+    if resp.status_code in (200, 201, 204):
+        if dry_run:
+            # Return the diff results
+            try:
+                result = orjson.loads(resp.content)
+                logger.info(f"✓ Dry-run completed for Loopback{loopback_id}")
+                return result
+            except (ValueError, KeyError):
+                logger.info("✓ Dry-run completed (no diff returned)")
+                return {"status": "no-changes"}
+        else:
+            logger.info(f"✓ Loopback{loopback_id} configured successfully")
+            return True
+
+    logger.error(f"✗ Failed to configure Loopback{loopback_id}")
+    return False
 
 
 class NSOClient:
@@ -31,6 +140,10 @@ class NSOClient:
         verify_ssl: bool = False,
         use_https: bool = False,
         timeout: float = 30.0,
+        cache_ttl: float = 30.0,
+        sync_ttl: float = 10.0,
+        retries: int = 3,
+        warmup: bool = False,
     ):
         """
         Initialize NSO client.
@@ -42,6 +155,13 @@ class NSOClient:
             password: NSO password
             verify_ssl: Verify SSL certificates (False for sandbox)
             timeout: Default timeout for requests in seconds
+            cache_ttl: Seconds to reuse device-list / rollback-file lookups (0 disables)
+            sync_ttl: Seconds a successful sync-from counts as fresh, so repeat
+                sync_from_device calls are skipped until a write (0 disables)
+            retries: Extra attempts for connect errors, and for timeouts / 502-504 on
+                idempotent methods, with exponential backoff plus jitter
+            warmup: Open the pooled connection now (one GET of the RESTCONF root) so the
+                first real call doesn't pay the TCP/TLS handshake
         """
         protocol = "https" if use_https else "http"
         self.host = host
@@ -50,10 +170,24 @@ class NSOClient:
         self.auth = (username, password)
         self.verify = verify_ssl
         self.timeout = timeout
-
-        # Create httpx client with default headers
+        self.retries = retries
+        if not verify_ssl:
+            _disable_insecure_warnings()
+
+        # Create httpx client with default headers. Auth is set once on the client;
+        # HTTP/2 is negotiated via ALPN on https (plain http stays on HTTP/1.1 keep-alive).
+        # Accept-Encoding is left to httpx: gzip/deflate, plus br via the brotli extra.
+        # An explicit transport ignores the client's http2/verify/limits, so they go here
         self.client = httpx.Client(
-            verify=self.verify,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                verify=self.verify,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0
+                ),
+                retries=retries,
+            ),
+            auth=httpx.BasicAuth(username, password),
             headers={
                 "Content-Type": "application/yang-data+json",
                 "Accept": "application/yang-data+json",
@@ -61,8 +195,75 @@ class NSOClient:
             timeout=self.timeout,
         )
 
+        # Prebuilt GET requests for static, polled URLs (see _get_cached_request)
+        self._req_cache: dict[str, httpx.Request] = {}
+
+        # Read-only discovery results: key -> (expires_at monotonic, value)
+        self.cache_ttl = cache_ttl
+        self._ttl_cache: dict[str, tuple[float, Any]] = {}
+
+        # Conditional GETs: (url, query) -> (ETag, body) of the last 200 seen
+        self._etags: dict[tuple[str, str], tuple[str, bytes]] = {}
+
+        # device -> monotonic time of its last successful sync-from (cleared on writes)
+        self.sync_ttl = sync_ttl
+        self._synced_at: dict[str, float] = {}
+
         logger.info(f"Initialized NSO client for {host}:{port}")
 
+        if warmup:
+            self.warmup()
+
+    @classmethod
+    def shared(
+        cls,
+        host: str,
+        port: int = 8080,
+        username: str = "developer",
+        password: str = "C1sco12345",
+        verify_ssl: bool = False,
+        use_https: bool = False,
+        **kwargs,
+    ) -> "NSOClient":
+        """
+        Return the process-wide client for these connection settings, creating it on first use.
+
+        Callers talking to the same NSO with the same credentials and transport
+        settings reuse one connection pool instead of each building its own
+        client. Other kwargs (timeout, warmup, ...) only apply when the client is
+        created. Don't close() a shared client; use close_shared().
+        """
+        key = (host, port, username, password, use_https, verify_ssl)
+        with _SHARED_LOCK:
+            client = _SHARED_CLIENTS.get(key)
+            if client is None:
+                client = _SHARED_CLIENTS[key] = cls(
+                    host,
+                    port,
+                    username,
+                    password,
+                    verify_ssl=verify_ssl,
+                    use_https=use_https,
+                    **kwargs,
+                )
+        return client
+
+    @staticmethod
+    def close_shared() -> None:
+        """Close and forget every client handed out by shared()."""
+        with _SHARED_LOCK:
+            for client in _SHARED_CLIENTS.values():
+                client.close()
+            _SHARED_CLIENTS.clear()
+
+    def warmup(self) -> None:
+        """Establish the keep-alive connection ahead of the first real request."""
+        try:
+            self.client.get(self.base_url)
+        except httpx.HTTPError as e:
+            # Best effort: the first real request will connect (and report) instead
+            logger.debug("Warm-up request to {} failed: {}", self.base_url, e)
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -76,99 +277,190 @@ class NSOClient:
         self.client.close()
         logger.debug("NSO client closed")
 
-    def _safe_get(self, url: str, **kwargs) -> dict[str, Any] | None:
+    def _get_cached_request(self, url: str) -> httpx.Request:
+        """Build the GET request for a static URL once and reuse it on every poll."""
+        req = self._req_cache.get(url)
+        if req is None:
+            req = self._req_cache[url] = self.client.build_request("GET", url)
+        return req
+
+    def _cache_get(self, key: str) -> Any | None:
+        """Return the cached value for key if it hasn't expired."""
+        hit = self._ttl_cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            logger.debug("Cache hit: {}", key)
+            return hit[1]
+        return None
+
+    def _cache_put(self, key: str, value: Any) -> None:
+        if self.cache_ttl > 0:
+            self._ttl_cache[key] = (time.monotonic() + self.cache_ttl, value)
+
+    def invalidate_cache(self, key: str | None = None) -> None:
+        """Drop one cached lookup ("devices", "rollback_files"), or all of them."""
+        if key is None:
+            self._ttl_cache.clear()
+        else:
+            self._ttl_cache.pop(key, None)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | str | bytes | None = None,
+        content_type: str | None = None,
+        cached: bool = False,
+        **kwargs,
+    ) -> httpx.Response | None:
         """
-        Safe GET request with error handling and logging.
+        Send one request with the shared error handling.
 
         Args:
-            url: Full URL to query
+            method: HTTP method
+            url: Full URL
+            payload: JSON-able dict, or a str/bytes body sent as-is with content_type
+            content_type: Content-Type for a str/bytes payload (e.g. YANG XML)
+            cached: Reuse a prebuilt GET request for this URL (static URLs, no kwargs)
             **kwargs: Additional httpx arguments
 
         Returns:
-            JSON response as dict, or None on error
+            The response, or None on an HTTP error status or transport failure
         """
+        if method != "GET":
+            # Any committed write can add a rollback file, and makes stored ETags
+            # (almost certainly) stale; NSO would just answer 200 for those anyway
+            self.invalidate_cache("rollback_files")
+            self._etags.clear()
+        attempts = 1 + (self.retries if method in _IDEMPOTENT_METHODS else 0)
         try:
-            logger.debug(f"GET {url}")
-            resp = self.client.get(url, auth=self.auth, **kwargs)
-            resp.raise_for_status()
-
-            if resp.status_code == 204:
-                logger.debug("Received 204 No Content")
-                return {}
-
-            return resp.json()
+            for attempt in range(attempts):
+                last = attempt == attempts - 1
+                try:
+                    resp = self._send(method, url, payload, content_type, cached, **kwargs)
+                except httpx.TimeoutException:
+                    if last:
+                        raise
+                    self._backoff(method, url, attempt, "timeout")
+                    continue
+                # Positional args: loguru only formats the message if a sink takes DEBUG.
+                # http_version shows whether ALPN negotiated HTTP/2 (https) or fell back to 1.1
+                logger.debug("{} {} -> {} {}", method, url, resp.status_code, resp.http_version)
+                if last or resp.status_code not in _RETRY_STATUSES:
+                    break
+                self._backoff(method, url, attempt, resp.status_code)
+            if resp.status_code != 304:  # Not Modified answers our If-None-Match
+                resp.raise_for_status()
+            if method != "GET" and not url.endswith("/sync-from"):
+                # A committed config write (or rollback) means device and CDB may have
+                # moved; sync-from RPCs themselves are what make a device fresh
+                self._synced_at.clear()
+            return resp
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error on GET {url}: {e.response.status_code} - {e.response.text}")
+            logger.error(
+                f"HTTP error on {method} {url}: {e.response.status_code} - {e.response.text}"
+            )
             return None
         except httpx.TimeoutException:
-            logger.error(f"Timeout on GET {url}")
+            logger.error(f"Timeout on {method} {url}")
             return None
         except httpx.RequestError as e:
-            logger.error(f"Request failed on GET {url}: {str(e)}")
+            logger.error(f"Request failed on {method} {url}: {str(e)}")
             return None
-        except ValueError as e:
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | str | bytes | None,
+        content_type: str | None,
+        cached: bool,
+        **kwargs,
+    ) -> httpx.Response:
+        """One attempt of _request: pick the body encoding and send."""
+        if cached and not kwargs:
+            return self.client.send(self._get_cached_request(url))
+        if isinstance(payload, str | bytes) and content_type:
+            headers = {"Content-Type": content_type, "Accept": "application/yang-data+json"}
+            return self.client.request(method, url, content=payload, headers=headers, **kwargs)
+        if payload is not None:
+            # orjson instead of httpx's stdlib json encoder; the client already
+            # sends Content-Type: application/yang-data+json
+            return self.client.request(method, url, content=orjson.dumps(payload), **kwargs)
+        return self.client.request(method, url, **kwargs)
+
+    @staticmethod
+    def _backoff(method: str, url: str, attempt: int, reason: Any) -> None:
+        """Sleep before retry `attempt + 1`: exponential, capped, plus jitter."""
+        delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt)
+        delay += random.uniform(0, _RETRY_BASE_DELAY)
+        logger.warning(f"{method} {url}: {reason}, retrying in {delay:.2f}s")
+        time.sleep(delay)
+
+    def _safe_get(self, url: str, cached: bool = False, **kwargs) -> dict[str, Any] | None:
+        """
+        Safe GET request with error handling and logging.
+
+        Args:
+            url: Full URL to query
+            cached: Reuse a prebuilt request for this URL (static URLs, no kwargs)
+            **kwargs: Additional httpx arguments
+
+        Returns:
+            JSON response as dict, or None on error
+        """
+        # Revalidate a previously seen body with If-None-Match; a 304 skips the transfer
+        etag_key = None if cached else (url, str(kwargs.get("params") or ""))
+        hit = self._etags.get(etag_key) if etag_key else None
+        if hit is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": hit[0]}
+
+        resp = self._request("GET", url, cached=cached, **kwargs)
+        if resp is None:
+            return None
+
+        if resp.status_code == 204:
+            logger.debug("Received 204 No Content")
+            return {}
+
+        if resp.status_code == 304 and hit is not None:
+            logger.debug("Not modified: {}", url)
+            body = hit[1]
+        else:
+            body = resp.content
+            etag = resp.headers.get("ETag")
+            if etag and etag_key:
+                self._etags[etag_key] = (etag, body)
+
+        try:
+            return orjson.loads(body)
+        except ValueError as e:  # includes orjson.JSONDecodeError
             logger.error(f"Invalid JSON response from {url}: {str(e)}")
             return None
 
     def _safe_post(
-        self, url: str, payload: dict[str, Any] | str, content_type: str | None = None, **kwargs
+        self,
+        url: str,
+        payload: dict[str, Any] | str | bytes,
+        content_type: str | None = None,
+        **kwargs,
     ) -> httpx.Response | None:
         """Safe POST request with error handling."""
-        try:
-            logger.debug(f"POST {url}")
-
-            # Handle XML payloads
-            if isinstance(payload, str) and content_type:
-                headers = {"Content-Type": content_type, "Accept": "application/yang-data+json"}
-                resp = self.client.post(
-                    url, content=payload, auth=self.auth, headers=headers, **kwargs
-                )
-            else:
-                # Normal JSON payload
-                resp = self.client.post(url, json=payload, auth=self.auth, **kwargs)
-
-            resp.raise_for_status()
-            return resp
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error on POST {url}: {e.response.status_code} - {e.response.text}")
-            return None
-        except httpx.RequestError as e:
-            logger.error(f"Request failed on POST {url}: {str(e)}")
-            return None
+        return self._request("POST", url, payload, content_type, **kwargs)
 
-    def _safe_patch(self, url: str, payload: dict[str, Any], **kwargs) -> httpx.Response | None:
+    def _safe_patch(
+        self,
+        url: str,
+        payload: dict[str, Any] | str | bytes,
+        content_type: str | None = None,
+        **kwargs,
+    ) -> httpx.Response | None:
         """Safe PATCH request with error handling."""
-        try:
-            logger.debug(f"PATCH {url}")
-            resp = self.client.patch(url, json=payload, auth=self.auth, **kwargs)
-            resp.raise_for_status()
-            return resp
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error on PATCH {url}: {e.response.status_code} - {e.response.text}")
-            return None
-        except httpx.RequestError as e:
-            logger.error(f"Request failed on PATCH {url}: {str(e)}")
-            return None
+        return self._request("PATCH", url, payload, content_type, **kwargs)
 
     def _safe_delete(self, url: str, **kwargs) -> httpx.Response | None:
         """Safe DELETE request with error handling."""
-        try:
-            logger.debug(f"DELETE {url}")
-            resp = self.client.delete(url, auth=self.auth, **kwargs)
-            resp.raise_for_status()
-            return resp
-
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                f"HTTP error on DELETE {url}: {e.response.status_code} - {e.response.text}"
-            )
-            return None
-        except httpx.RequestError as e:
-            logger.error(f"Request failed on DELETE {url}: {str(e)}")
-            return None
+        return self._request("DELETE", url, **kwargs)
 
     def health_check(self) -> bool:
         """
@@ -178,7 +470,7 @@ class NSOClient:
             True if NSO responds successfully
         """
         url = f"{self.base_url}/data/tailf-ncs:devices"
-        result = self._safe_get(url)
+        result = self._safe_get(url, cached=True)
 
         if result is not None:
             logger.info("✓ NSO health check passed")
@@ -194,52 +486,118 @@ class NSOClient:
         Returns:
             List of device names, or None on error
         """
-        url = f"{self.base_url}/data/tailf-ncs:devices/device"
-        result = self._safe_get(url)
+        devices = self._cache_get("devices")
+        if devices is not None:
+            return list(devices)
+
+        # fields=name keeps NSO from serializing every device's config/state, and the
+        # names are picked out of the stream so the body is never buffered whole
+        url = f"{self.base_url}/data/tailf-ncs:devices/device?fields=name"
+        devices = self._stream_values(url, "tailf-ncs:device.item.name")
 
-        if result and "tailf-ncs:device" in result:
-            devices = [d["name"] for d in result["tailf-ncs:device"]]
+        if devices:
             logger.info(f"Found {len(devices)} devices: {devices}")
-            return devices
+            self._cache_put("devices", devices)
+            return list(devices)
 
         logger.warning("No devices found or query failed")
         return None
 
-    def sync_from_device(self, device_name: str) -> bool:
+    def sync_from_device(self, device_name: str, force: bool = False) -> bool:
         """
         Sync configuration from device to NSO (sync-from).
 
+        Skipped if the device was synced less than sync_ttl seconds ago and no
+        write has gone through this client since.
+
         Args:
             device_name: Name of device to sync
+            force: Sync even if the last sync is still fresh
 
         Returns:
             True if sync successful
         """
-        url = f"{self.base_url}/data/tailf-ncs:devices/device={device_name}/sync-from"
-        payload = {"input": {}}
+        synced_at = self._synced_at.get(device_name)
+        if not force and synced_at is not None:
+            if time.monotonic() - synced_at < self.sync_ttl:
+                logger.debug("Skipping sync-from for {}: synced recently", device_name)
+                return True
+
+        url = f"{_device_url(self.base_url, device_name)}/sync-from"
 
         logger.info(f"Syncing from device: {device_name}")
-        resp = self._safe_post(url, payload)
+        resp = self._safe_post(url, _EMPTY_INPUT, content_type="application/yang-data+json")
 
         if resp and resp.status_code in (200, 204):
             logger.info(f"✓ Sync-from successful for {device_name}")
+            self._synced_at[device_name] = time.monotonic()
             return True
 
         logger.error(f"✗ Sync-from failed for {device_name}")
         return False
 
-    def get_device_config(self, device_name: str) -> dict[str, Any] | None:
+    def sync_from_devices(self, device_names: list[str]) -> dict[str, bool]:
+        """
+        Sync several devices in one RPC (devices/sync-from with a device list).
+
+        NSO runs the per-device syncs in parallel server-side, so this is one
+        client round-trip instead of one per device.
+
+        Args:
+            device_names: Devices to sync
+
+        Returns:
+            {device: success} for every requested device
+        """
+        url = f"{self.base_url}/data/tailf-ncs:devices/sync-from"
+        payload = {"input": {"device": device_names}}
+
+        logger.info(f"Syncing from {len(device_names)} devices: {device_names}")
+        resp = self._safe_post(url, payload)
+        results = dict.fromkeys(device_names, False)
+
+        if not resp or resp.status_code not in (200, 204):
+            logger.error("✗ Batch sync-from failed")
+            return results
+
+        now = time.monotonic()
+        if resp.status_code == 204:  # no per-device report: the action succeeded as a whole
+            logger.info(f"✓ Sync-from successful for {len(device_names)} devices")
+            self._synced_at.update(dict.fromkeys(device_names, now))
+            return dict.fromkeys(device_names, True)
+
+        try:
+            output = orjson.loads(resp.content).get("tailf-ncs:output", {})
+        except ValueError:
+            output = {}
+        for item in output.get("sync-result", []):
+            ok = item.get("result") is True
+            results[item.get("device")] = ok
+            if ok:
+                self._synced_at[item.get("device")] = now
+            else:
+                logger.error(f"✗ Sync-from failed for {item.get('device')}: {item.get('info')}")
+
+        logger.info(f"✓ Sync-from complete: {sum(results.values())}/{len(results)} succeeded")
+        return results
+
+    def get_device_config(
+        self, device_name: str, subtree: str | None = None, depth: int | None = None
+    ) -> dict[str, Any] | None:
         """
-        Get full configuration for a device from NSO CDB.
+        Get configuration for a device from NSO CDB.
 
         Args:
             device_name: Name of device
+            subtree: Path under /config to read instead of the whole tree,
+                e.g. "tailf-ned-cisco-ios:interface/Loopback"
+            depth: RESTCONF depth= limit on how many levels NSO serializes
 
         Returns:
             Device config as dict, or None on error
         """
-        url = f"{self.base_url}/data/tailf-ncs:devices/device={device_name}/config"
-        result = self._safe_get(url)
+        url = _device_config_url(self.base_url, device_name, subtree)
+        result = self._safe_get(url, params=_depth_params(depth))
 
         if result:
             logger.info(f"Retrieved config for {device_name}")
@@ -248,13 +606,151 @@ class NSOClient:
         logger.error(f"Failed to get config for {device_name}")
         return None
 
+    def get_bgp_config(self, device_name: str) -> dict[str, Any] | None:
+        """
+        Get only the BGP process config for a device from NSO CDB.
+
+        Scoped GET on .../config/tailf-ned-cisco-ios:router/bgp instead of the
+        full device config.
+
+        Args:
+            device_name: Name of device
+
+        Returns:
+            BGP process config (as-no, bgp-router-id, neighbor, ...), or None
+            if not configured or on error
+        """
+        url = _device_config_url(self.base_url, device_name, "tailf-ned-cisco-ios:router/bgp")
+        result = self._safe_get(url)
+
+        bgp = (result or {}).get("tailf-ned-cisco-ios:bgp")
+        # bgp is a list keyed on as-no in the NED; IOS runs a single process
+        if isinstance(bgp, list):
+            bgp = bgp[0] if bgp else None
+
+        if bgp:
+            logger.info(f"Retrieved BGP config for {device_name}")
+            return bgp
+
+        logger.info(f"No BGP config found for {device_name}")
+        return None
+
+    def _stream_values(self, url: str, prefix: str) -> list[Any] | None:
+        """
+        GET a static URL (prebuilt request) and collect every value at ijson `prefix`.
+
+        Values are parsed out of the response as chunks arrive, so only the
+        matches are kept, never the whole body or its decoded tree.
+
+        Returns:
+            The values in document order ([] on 204), or None on error
+        """
+        found: list[Any] = ijson.sendable_list()
+        parser = ijson.items_coro(found, prefix, use_float=True)
+        values: list[Any] = []
+
+        try:
+            logger.debug("GET (stream) {} prefix={}", url, prefix)
+            resp = self.client.send(self._get_cached_request(url), stream=True)
+            try:
+                resp.raise_for_status()
+                if resp.status_code == 204:
+                    return []
+                for chunk in resp.iter_bytes():
+                    parser.send(chunk)
+                    values.extend(found)
+                    del found[:]
+            finally:
+                resp.close()
+            parser.close()
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error on GET {url}: {e.response.status_code}")
+            return None
+        except httpx.TimeoutException:
+            logger.error(f"Timeout on GET {url}")
+            return None
+        except httpx.RequestError as e:
+            logger.error(f"Request failed on GET {url}: {str(e)}")
+            return None
+        except ijson.JSONError as e:
+            logger.error(f"Invalid JSON response from {url}: {str(e)}")
+            return None
+
+        values.extend(found)
+        return values
+
+    def get_device_config_field(self, device_name: str, prefix: str) -> Any | None:
+        """
+        Stream a device's config and return only the sub-tree at `prefix`.
+
+        The response is fed to an incremental (ijson) parser chunk by chunk, so
+        the full multi-megabyte config is never held in memory, and the
+        download stops as soon as the first match is complete.
+
+        Args:
+            device_name: Name of device
+            prefix: ijson prefix below the config root, dot-separated, e.g.
+                "tailf-ncs:config.tailf-ned-cisco-ios:interface.Loopback"
+
+        Returns:
+            The first value at `prefix`, or None if absent or on error
+        """
+        url = _device_config_url(self.base_url, device_name)
+        found: list[Any] = ijson.sendable_list()
+        parser = ijson.items_coro(found, prefix, use_float=True)
+
+        try:
+            logger.debug("GET (stream) {} prefix={}", url, prefix)
+            with self.client.stream("GET", url) as resp:
+                resp.raise_for_status()
+                for chunk in resp.iter_bytes():
+                    parser.send(chunk)
+                    if found:
+                        logger.info(f"Retrieved {prefix} for {device_name}")
+                        return found[0]
+            parser.close()
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error on GET {url}: {e.response.status_code}")
+            return None
+        except httpx.TimeoutException:
+            logger.error(f"Timeout on GET {url}")
+            return None
+        except httpx.RequestError as e:
+            logger.error(f"Request failed on GET {url}: {str(e)}")
+            return None
+        except ijson.JSONError as e:
+            logger.error(f"Invalid JSON response from {url}: {str(e)}")
+            return None
+
+        if found:
+            logger.info(f"Retrieved {prefix} for {device_name}")
+            return found[0]
+
+        logger.warning(f"{prefix} not found in config for {device_name}")
+        return None
+
     def get_interface_config(
-        self, device_name: str, interface_type: str, interface_id: str
+        self,
+        device_name: str,
+        interface_type: str,
+        interface_id: str,
+        fields: str | None = INTERFACE_FIELDS,
     ) -> dict[str, Any] | None:
-        """Get specific interface configuration."""
-        # Change from Loopback=100 to Loopback/100
-        url = f"{self.base_url}/data/tailf-ncs:devices/device={device_name}/config/tailf-ned-cisco-ios:interface/{interface_type}={interface_id}"
-        result = self._safe_get(url)
+        """
+        Get specific interface configuration.
+
+        Args:
+            device_name: Target device
+            interface_type: Interface list name, e.g. "Loopback"
+            interface_id: Interface key, e.g. "100"
+            fields: RESTCONF fields= selector (default: name, primary IP, description);
+                pass None to read the full interface subtree
+        """
+        url = f"{_iface_url(self.base_url, device_name)}/{interface_type}={interface_id}"
+        params = httpx.QueryParams(fields=fields) if fields else None
+        result = self._safe_get(url, params=params)
 
         if result:
             logger.info(f"Retrieved {interface_type}{interface_id} config from {device_name}")
@@ -287,49 +783,49 @@ class NSOClient:
             True if successful, or dict with dry-run results if dry_run=True
         """
         # Build URL with optional dry-run parameter
-        base_url = f"{self.base_url}/data/tailf-ncs:devices/device={device_name}/config/tailf-ned-cisco-ios:interface"
+        base_url = _iface_url(self.base_url, device_name)
         url = f"{base_url}?dry-run=native" if dry_run else base_url
 
-        desc_xml = f"<description>{description}</description>" if description else ""
-        xml_payload = f"""
-        <Loopback>
-            <name>{loopback_id}</name>
-            {desc_xml}
-                <ip>
-                    <address>
-                        <primary>
-                            <address>{ip_address}</address>
-                            <mask>{netmask}</mask>
-                        </primary>
-                    </address>
-                </ip>
-        </Loopback>"""
+        xml_payload = _loopback_xml(loopback_id, ip_address, netmask, description)
 
         logger.info(
             f"{'[DRY-RUN] ' if dry_run else ''}Configuring Loopback{loopback_id} on {device_name}: {ip_address}/{netmask}"
         )
         resp = self._safe_post(url, xml_payload, content_type="application/yang-data+xml")
+        return _loopback_post_result(resp, loopback_id, dry_run)
 
-        if not resp:
-            logger.error(f"✗ Failed to configure Loopback{loopback_id}")
-            return False
+    def configure_loopbacks(
+        self,
+        device_name: str,
+        specs: list[tuple[str, str, str, str | None]],
+        dry_run: bool = False,
+    ) -> bool | dict[str, Any]:
+        """
+        Configure several loopbacks on one device in a single RESTCONF PATCH.
 
-        if resp.status_code in (200, 201, 204):
-            if dry_run:
-                # Return the diff results
-                try:
-                    result = resp.json()
-                    logger.info(f"✓ Dry-run completed for Loopback{loopback_id}")
-                    return result
-                except (ValueError, KeyError):
-                    logger.info("✓ Dry-run completed (no diff returned)")
-                    return {"status": "no-changes"}
-            else:
-                logger.info(f"✓ Loopback{loopback_id} configured successfully")
-                return True
+        All Loopback entries go in one <interface> body, so NSO applies them in
+        one transaction (one commit) instead of one POST + commit per loopback.
+        PATCH merges, so it covers both creates and updates.
 
-        logger.error(f"✗ Failed to configure Loopback{loopback_id}")
-        return False
+        Args:
+            device_name: Target device
+            specs: (loopback_id, ip_address, netmask, description) tuples
+            dry_run: If True, return diff without applying changes
+
+        Returns:
+            True if successful, or dict with dry-run results if dry_run=True
+        """
+        base_url = _iface_url(self.base_url, device_name)
+        url = f"{base_url}?dry-run=native" if dry_run else base_url
+
+        xml_payload = _INTERFACE_XML.format("".join(_loopback_xml(*spec) for spec in specs))
+        ids = ",".join(str(spec[0]) for spec in specs)
+
+        logger.info(
+            f"{'[DRY-RUN] ' if dry_run else ''}Configuring {len(specs)} loopbacks on {device_name}: {ids}"
+        )
+        resp = self._safe_patch(url, xml_payload, content_type="application/yang-data+xml")
+        return _loopback_post_result(resp, ids, dry_run)
 
     def configure_loopback_with_rollback_id(
         self,
@@ -345,21 +841,9 @@ class NSOClient:
         Returns:
             Tuple of (success: bool, rollback_fixed_number: int | None)
         """
-        url = f"{self.base_url}/data/tailf-ncs:devices/device={device_name}/config/tailf-ned-cisco-ios:interface?rollback-id=true"
-
-        desc_xml = f"<description>{description}</description>" if description else ""
-        xml_payload = f"""<Loopback>
-      <name>{loopback_id}</name>
-      {desc_xml}
-      <ip>
-        <address>
-          <primary>
-            <address>{ip_address}</address>
-            <mask>{netmask}</mask>
-          </primary>
-        </address>
-      </ip>
-    </Loopback>"""
+        url = f"{_iface_url(self.base_url, device_name)}?rollback-id=true"
+
+        xml_payload = _loopback_xml(loopback_id, ip_address, netmask, description)
 
         logger.info(f"Configuring Loopback{loopback_id} with rollback tracking")
         resp = self._safe_post(url, xml_payload, content_type="application/yang-data+xml")
@@ -370,7 +854,7 @@ class NSOClient:
 
         # Extract rollback-id from response body
         try:
-            result = resp.json()
+            result = orjson.loads(resp.content)
             rollback_fixed_number = (
                 result.get("tailf-restconf:result", {}).get("rollback", {}).get("id")
             )
@@ -397,13 +881,18 @@ class NSOClient:
         Returns:
             List of rollback file info, or None on error
         """
+        files = self._cache_get("rollback_files")
+        if files is not None:
+            return list(files)
+
         url = f"{self.base_url}/data/tailf-rollback:rollback-files"
-        result = self._safe_get(url)
+        result = self._safe_get(url, cached=True)
 
         if result and "tailf-rollback:rollback-files" in result:
             files = result["tailf-rollback:rollback-files"].get("file", [])
             logger.info(f"Found {len(files)} rollback files")
-            return files
+            self._cache_put("rollback_files", files)
+            return list(files)
 
         logger.warning("No rollback files found")
         return None
@@ -432,9 +921,7 @@ class NSOClient:
 
         # Build XML payload based on id type
         id_element = "fixed-number" if use_fixed_number else "id"
-        xml_payload = f"""<input xmlns="http://tail-f.com/ns/rollback">
-      <{id_element}>{rollback_id}</{id_element}>
-    </input>"""
+        xml_payload = _ROLLBACK_XML.format(tag=id_element, value=rollback_id)
 
         logger.warning(f"Rolling back using {id_element}={rollback_id}")
         resp = self._safe_post(url, xml_payload, content_type="application/yang-data+xml")
@@ -449,7 +936,7 @@ class NSOClient:
     def delete_loopback(self, device_name: str, loopback_id: str) -> bool:
         """Delete a loopback interface."""
         # Change from Loopback=100 to Loopback/100
-        url = f"{self.base_url}/data/tailf-ncs:devices/device={device_name}/config/tailf-ned-cisco-ios:interface/Loopback={loopback_id}"
+        url = f"{_iface_url(self.base_url, device_name)}/Loopback={loopback_id}"
 
         logger.info(f"Deleting Loopback{loopback_id} from {device_name}")
         resp = self._safe_delete(url)
@@ -460,3 +947,278 @@ class NSOClient:
 
         logger.error(f"✗ Failed to delete Loopback{loopback_id}")
         return False
+
+    def delete_loopbacks(
+        self, device_name: str, loopback_ids: list[str], no_networking: bool = False
+    ) -> bool:
+        """
+        Delete several loopbacks on one device in a single YANG Patch (one NSO transaction).
+
+        Uses the "remove" edit operation, so ids that don't exist are not an error.
+
+        Args:
+            device_name: Target device
+            loopback_ids: Loopback numbers to remove
+            no_networking: Commit to NSO's CDB only, without pushing to the device.
+                The device keeps the loopbacks until the next sync-to; a sync-from
+                would bring them back, so only use this against netsim/lab state
+                that is reset some other way.
+        """
+        url = _iface_url(self.base_url, device_name)
+        if no_networking:
+            url = f"{url}?no-networking"
+        patch = {
+            "ietf-yang-patch:yang-patch": {
+                "patch-id": "delete-loopbacks",
+                "edit": [
+                    {"edit-id": str(i), "operation": "remove", "target": f"/Loopback={lid}"}
+                    for i, lid in enumerate(loopback_ids)
+                ],
+            }
+        }
+        ids = ",".join(loopback_ids)
+
+        logger.info(f"Deleting {len(loopback_ids)} loopbacks from {device_name}: {ids}")
+        resp = self._safe_patch(
+            url, orjson.dumps(patch), content_type="application/yang-patch+json"
+        )
+
+        if resp and resp.status_code in (200, 204):
+            logger.info(f"✓ Loopbacks {ids} deleted successfully")
+            return True
+
+        logger.error(f"✗ Failed to delete loopbacks {ids}")
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Async client
+#
+# Fleet-wide operations (per-device sync/configure) are independent RTT-bound
+# calls; AsyncNSOClient runs them concurrently over one pooled connection,
+# bounded by a semaphore so NSO isn't flooded.
+# ---------------------------------------------------------------------------
+
+
+class AsyncNSOClient:
+    """Async counterpart of NSOClient (httpx.AsyncClient) for concurrent fan-out."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 8080,
+        username: str = "developer",
+        password: str = "C1sco12345",
+        verify_ssl: bool = False,
+        use_https: bool = False,
+        timeout: float = 30.0,
+        max_concurrency: int = 16,
+    ):
+        """
+        Initialize async NSO client.
+
+        Args:
+            host: NSO server hostname or IP
+            port: RESTCONF port (default 8080)
+            username: NSO username
+            password: NSO password
+            verify_ssl: Verify SSL certificates (False for sandbox)
+            timeout: Default timeout for requests in seconds
+            max_concurrency: Max in-flight requests for bulk operations
+        """
+        protocol = "https" if use_https else "http"
+        self.host = host
+        self.port = port
+        self.base_url = f"{protocol}://{host}:{port}/restconf"
+        self.verify = verify_ssl
+        self.timeout = timeout
+        if not verify_ssl:
+            _disable_insecure_warnings()
+        self._sem = asyncio.Semaphore(max_concurrency)
+
+        self.client = httpx.AsyncClient(
+            http2=True,
+            verify=self.verify,
+            auth=httpx.BasicAuth(username, password),
+            headers={
+                "Content-Type": "application/yang-data+json",
+                "Accept": "application/yang-data+json",
+            },
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_concurrency, max_connections=max_concurrency
+            ),
+        )
+
+        logger.info(f"Initialized async NSO client for {host}:{port}")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close client."""
+        await self.close()
+
+    async def close(self):
+        """Close the httpx async client."""
+        await self.client.aclose()
+        logger.debug("Async NSO client closed")
+
+    async def _request(
+        self, method: str, url: str, content_type: str | None = None, **kwargs
+    ) -> httpx.Response | None:
+        """Semaphore-gated request with the same error handling as NSOClient._safe_*."""
+        if content_type:
+            kwargs["headers"] = {
+                "Content-Type": content_type,
+                "Accept": "application/yang-data+json",
+            }
+        try:
+            logger.debug("{} {}", method, url)
+            async with self._sem:
+                resp = await self.client.request(method, url, **kwargs)
+            resp.raise_for_status()
+            return resp
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP error on {method} {url}: {e.response.status_code} - {e.response.text}"
+            )
+            return None
+        except httpx.TimeoutException:
+            logger.error(f"Timeout on {method} {url}")
+            return None
+        except httpx.RequestError as e:
+            logger.error(f"Request failed on {method} {url}: {str(e)}")
+            return None
+
+    async def _safe_get(self, url: str, **kwargs) -> dict[str, Any] | None:
+        """Safe GET returning parsed JSON, {} on 204, or None on error."""
+        resp = await self._request("GET", url, **kwargs)
+        if resp is None:
+            return None
+        if resp.status_code == 204:
+            return {}
+        try:
+            return orjson.loads(resp.content)
+        except ValueError as e:
+            logger.error(f"Invalid JSON response from {url}: {str(e)}")
+            return None
+
+    async def health_check(self) -> bool:
+        """Verify NSO is reachable and responsive."""
+        result = await self._safe_get(f"{self.base_url}/data/tailf-ncs:devices")
+        if result is not None:
+            logger.info("✓ NSO health check passed")
+            return True
+        logger.error("✗ NSO health check failed")
+        return False
+
+    async def sync_from_device(self, device_name: str) -> bool:
+        """Sync configuration from device to NSO (sync-from)."""
+        url = f"{_device_url(self.base_url, device_name)}/sync-from"
+        logger.info(f"Syncing from device: {device_name}")
+        resp = await self._request("POST", url, content=_EMPTY_INPUT)
+
+        if resp and resp.status_code in (200, 204):
+            logger.info(f"✓ Sync-from successful for {device_name}")
+            return True
+
+        logger.error(f"✗ Sync-from failed for {device_name}")
+        return False
+
+    async def get_device_config(
+        self, device_name: str, subtree: str | None = None, depth: int | None = None
+    ) -> dict[str, Any] | None:
+        """Get configuration for a device from NSO CDB (optionally one subtree / depth)."""
+        url = _device_config_url(self.base_url, device_name, subtree)
+        result = await self._safe_get(url, params=_depth_params(depth))
+
+        if result:
+            logger.info(f"Retrieved config for {device_name}")
+            return result
+
+        logger.error(f"Failed to get config for {device_name}")
+        return None
+
+    async def get_interface_config(
+        self,
+        device_name: str,
+        interface_type: str,
+        interface_id: str,
+        fields: str | None = INTERFACE_FIELDS,
+    ) -> dict[str, Any] | None:
+        """Get specific interface configuration (fields=None for the full subtree)."""
+        url = f"{_iface_url(self.base_url, device_name)}/{interface_type}={interface_id}"
+        params = httpx.QueryParams(fields=fields) if fields else None
+        result = await self._safe_get(url, params=params)
+
+        if result:
+            logger.info(f"Retrieved {interface_type}{interface_id} config from {device_name}")
+            return result
+
+        logger.warning(f"{interface_type}{interface_id} not found on {device_name}")
+        return None
+
+    async def configure_loopback(
+        self,
+        device_name: str,
+        loopback_id: str,
+        ip_address: str,
+        netmask: str,
+        description: str | None = None,
+        dry_run: bool = False,
+    ) -> bool | dict[str, Any]:
+        """Configure a loopback interface; same contract as NSOClient.configure_loopback."""
+        base_url = _iface_url(self.base_url, device_name)
+        url = f"{base_url}?dry-run=native" if dry_run else base_url
+
+        logger.info(
+            f"{'[DRY-RUN] ' if dry_run else ''}Configuring Loopback{loopback_id} on {device_name}: {ip_address}/{netmask}"
+        )
+        resp = await self._request(
+            "POST",
+            url,
+            content=_loopback_xml(loopback_id, ip_address, netmask, description),
+            content_type="application/yang-data+xml",
+        )
+        return _loopback_post_result(resp, loopback_id, dry_run)
+
+    async def delete_loopback(self, device_name: str, loopback_id: str) -> bool:
+        """Delete a loopback interface."""
+        url = f"{_iface_url(self.base_url, device_name)}/Loopback={loopback_id}"
+
+        logger.info(f"Deleting Loopback{loopback_id} from {device_name}")
+        resp = await self._request("DELETE", url)
+
+        if resp and resp.status_code in (200, 204):
+            logger.info(f"✓ Loopback{loopback_id} deleted successfully")
+            return True
+
+        logger.error(f"✗ Failed to delete Loopback{loopback_id}")
+        return False
+
+    async def sync_from_devices(self, device_names: list[str]) -> dict[str, bool]:
+        """sync-from every device concurrently; returns {device: success}."""
+        results = await asyncio.gather(*(self.sync_from_device(d) for d in device_names))
+        return dict(zip(device_names, results))
+
+    async def configure_loopbacks_bulk(
+        self, specs: list[tuple[str, str, str, str, str | None]], dry_run: bool = False
+    ) -> list[bool | dict[str, Any]]:
+        """
+        Configure many loopbacks concurrently (at most max_concurrency in flight).
+
+        Args:
+            specs: (device_name, loopback_id, ip_address, netmask, description) tuples
+            dry_run: Apply ?dry-run=native to every request
+
+        Returns:
+            Per-spec results, in input order
+
+        Example:
+            async with AsyncNSOClient("10.10.20.49") as nso:
+                await nso.configure_loopbacks_bulk([("r1", "100", "10.0.0.1", "255.255.255.255", None)])
+        """
+        return await asyncio.gather(*(self.configure_loopback(*s, dry_run=dry_run) for s in specs))
@@ -5,21 +5,34 @@ This module provides template rendering capabilities for generating
 device-specific configurations from reusable templates.
 """
 
+import io
+import os
+from collections.abc import Iterator
+from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateNotFound
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    TemplateNotFound,
+)
 from loguru import logger
 
 
 class TemplateRenderer:
     """Jinja2 template renderer for network configurations."""
 
-    def __init__(self, template_dir: str | Path | None = None):
+    def __init__(self, template_dir: str | Path | None = None, auto_reload: bool = False):
         """
         Initialize template renderer.
 
         Args:
             template_dir: Root directory for templates. If None, uses
                          nso_orchestration/templates/
+            auto_reload: Re-stat template files on every get_template (only
+                         useful while editing templates in a long-lived process)
         """
         if template_dir is None:
             # Default: templates/ directory relative to this file
@@ -31,9 +44,20 @@ class TemplateRenderer:
             logger.warning(f"Template directory does not exist: {self.template_dir}")
             self.template_dir.mkdir(parents=True, exist_ok=True)
 
+        # Compiled templates are cached on disk and reused by later processes (CLI runs).
+        # Jinja's default directory is per-uid (_jinja2-cache-<uid>, 0700, ownership
+        # checked), so another user can't plant marshalled bytecode for us to load
+        try:
+            bytecode_cache = FileSystemBytecodeCache()
+        except (OSError, RuntimeError) as e:
+            logger.debug(f"Jinja2 bytecode cache disabled: {e}")
+            bytecode_cache = None
+
         # Create Jinja2 environment
         self.env = Environment(
             loader=FileSystemLoader(str(self.template_dir)),
+            bytecode_cache=bytecode_cache,
+            auto_reload=auto_reload,
             undefined=StrictUndefined,  # Fail fast if variable is missing
             trim_blocks=True,  # Remove first newline after block
             lstrip_blocks=True,  # Remove leading spaces/tabs before block
@@ -65,8 +89,8 @@ class TemplateRenderer:
                 neighbor_ip='10.0.0.2'
             )
         """
-        logger.debug(f"Rendering template: {template_name}")
-        logger.debug(f"Context variables: {list(context.keys())}")
+        logger.debug("Rendering template: {}", template_name)
+        logger.opt(lazy=True).debug("Context variables: {}", lambda: list(context))
 
         try:
             template = self.env.get_template(template_name)
@@ -83,6 +107,22 @@ class TemplateRenderer:
             logger.error(f"Error rendering template {template_name}: {e}")
             raise
 
+    def render_bytes(self, template_name: str, **context) -> bytes:
+        """
+        Render a template straight to UTF-8 bytes (e.g. an HTTP body or artifact file).
+
+        Streams the output into a buffer instead of building the whole str and
+        encoding it afterwards.
+        """
+        logger.debug("Rendering template (bytes): {}", template_name)
+
+        buf = io.BytesIO()
+        self.env.get_template(template_name).stream(**context).dump(buf, encoding="utf-8")
+        rendered = buf.getvalue()
+
+        logger.info(f"✓ Template rendered: {template_name} ({len(rendered)} bytes)")
+        return rendered
+
     def list_templates(self, pattern: str = "**/*.j2") -> list[Path]:
         """
         List all available templates.
@@ -93,14 +133,20 @@ class TemplateRenderer:
         Returns:
             List of template paths relative to template_dir
         """
-        templates = list(self.template_dir.glob(pattern))
-
-        # Make paths relative to template_dir
-        relative_templates = [
-            t.relative_to(self.template_dir) for t in templates
-        ]
-
-        logger.debug(f"Found {len(relative_templates)} templates matching '{pattern}'")
+        name_pattern = pattern[3:] if pattern.startswith("**/") else None
+        if name_pattern and "/" not in name_pattern:
+            # Recursive filename match: one scandir walk, no per-entry stat
+            relative_templates = [
+                Path(p).relative_to(self.template_dir)
+                for p in _scan_files(str(self.template_dir), name_pattern)
+            ]
+        else:
+            # Make paths relative to template_dir
+            relative_templates = [
+                t.relative_to(self.template_dir) for t in self.template_dir.glob(pattern)
+            ]
+
+        logger.debug("Found {} templates matching '{}'", len(relative_templates), pattern)
         return relative_templates
 
     def validate_template(self, template_name: str, **sample_context) -> bool:
@@ -123,6 +169,31 @@ class TemplateRenderer:
             return False
 
 
+def _scan_files(root: str, name_pattern: str) -> Iterator[str]:
+    """Yield paths of files under `root` whose name matches `name_pattern` (DirEntry d_type, no stat)."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path, name_pattern)
+            elif entry.is_file(follow_symlinks=False) and fnmatch(entry.name, name_pattern):
+                yield entry.path
+
+
+@lru_cache(maxsize=8)
+def _get_renderer(template_dir: str | None) -> TemplateRenderer:
+    """One TemplateRenderer per directory, so its Environment and template cache are reused."""
+    return TemplateRenderer(template_dir=template_dir)
+
+
+def get_renderer(template_dir: str | Path | None = None) -> TemplateRenderer:
+    """
+    Shared renderer for `template_dir` (default: nso_orchestration/templates/).
+
+    Jinja2 Environments are safe to share across threads for get_template/render.
+    """
+    return _get_renderer(str(template_dir) if template_dir is not None else None)
+
+
 # Convenience function for simple rendering
 def render_template(template_name: str, template_dir: str | Path | None = None, **context) -> str:
     """
@@ -136,5 +207,4 @@ def render_template(template_name: str, template_dir: str | Path | None = None,
     Returns:
         Rendered template string
     """
-    renderer = TemplateRenderer(template_dir=template_dir)
-    return renderer.render(template_name, **context)
\ No newline at end of file
+    return get_renderer(template_dir).render(template_name, **context)
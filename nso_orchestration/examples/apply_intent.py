@@ -6,25 +6,24 @@ This script reads the intent file (desired state), compares it to
 actual device state, and applies only the necessary changes.
 """
 
-import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
-from decouple import config
 from loguru import logger
 
-from nso_orchestration.automation.intent_engine import IntentEngine
-from nso_orchestration.automation.intent_models import NetworkIntent
-from nso_orchestration.automation.nso_client import NSOClient
+# The NSO client, intent models (pydantic schema build) and engine are imported
+# inside the functions that use them, so --help and bad-path exits stay fast.
+if TYPE_CHECKING:
+    from nso_orchestration.automation.intent_models import NetworkIntent
 
 
-def load_intent_from_yaml(file_path: Path) -> NetworkIntent:
+def load_intent_from_yaml(file_path: Path) -> "NetworkIntent":
     """
     Load and validate network intent from YAML file.
 
     Args:
-        file_path: Path to YAML intent file
+        file_path: Path to YAML (or .json) intent file
 
     Returns:
         Validated NetworkIntent object
@@ -32,13 +31,12 @@ def load_intent_from_yaml(file_path: Path) -> NetworkIntent:
     Raises:
         ValidationError: If intent file is invalid
     """
-    logger.info(f"Loading intent from {file_path}")
+    from nso_orchestration.automation.intent_models import NetworkIntent
 
-    with open(file_path) as f:
-        intent_data = yaml.safe_load(f)
+    logger.info(f"Loading intent from {file_path}")
 
-    # Validate with Pydantic
-    intent = NetworkIntent(**intent_data)
+    # Parse + validate with Pydantic
+    intent = NetworkIntent.load(file_path)
     logger.info(f"✓ Intent validated: {len(intent.devices)} devices")
 
     return intent
@@ -85,15 +83,20 @@ Examples:
         logger.error(f"Intent file not found: {intent_file}")
         return 1
 
+    import orjson
+
+    from nso_orchestration.automation.intent_engine import IntentEngine
+    from nso_orchestration.automation.nso_client import NSOClient
+    from nso_orchestration.settings import NSO_HOST, NSO_PW, NSO_USER
+
     try:
         # Load and validate intent
         intent = load_intent_from_yaml(intent_file)
 
         # Connect to NSO
-        nso_host = config("NSO_HOST", default="10.10.20.49")
-        logger.info(f"Connecting to NSO at {nso_host}")
+        logger.info(f"Connecting to NSO at {NSO_HOST}")
 
-        with NSOClient(host=nso_host) as client:
+        with NSOClient(host=NSO_HOST, username=NSO_USER, password=NSO_PW) as client:
             # Health check
             if not client.health_check():
                 logger.error("NSO health check failed")
@@ -114,7 +117,7 @@ Examples:
                     "changes": {"successful": success, "failed": failed},
                     "status": "success" if failed == 0 else "partial_failure",
                 }
-                print(json.dumps(result, indent=2))
+                print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
 
             # Return exit code
             return 0 if failed == 0 else 1
@@ -1,18 +1,36 @@
-import json
 from pprint import pprint
 
+import orjson
 import requests
-from decouple import config
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
-cli_url = "http://10.10.20.49:8080/restconf/data/tailf-ncs:devices/device=core-rtr01/live-status/tailf-ned-cisco-ios-xr-stats:exec/any"
-user = config("NSO_USER")
-passwd = config("NSO_PW")
+from nso_orchestration.settings import NSO_HOST, NSO_PW, NSO_USER
 
-payload = json.dumps({"input": {"args": "show ip interface brief"}})
+cli_url = f"http://{NSO_HOST}:8080/restconf/data/tailf-ncs:devices/device=core-rtr01/live-status/tailf-ned-cisco-ios-xr-stats:exec/any"
+
+# One pooled keep-alive session (auth set once) so repeated exec calls skip the TCP handshake
+_SESSION = requests.Session()
+_SESSION.auth = HTTPBasicAuth(NSO_USER, NSO_PW)
+_ADAPTER = HTTPAdapter(
+    pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.2)
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Fixed envelope; only the command string needs JSON-escaping per call
+_PAYLOAD_FMT = b'{"input":{"args":%s}}'
 headers = {"Accept": "application/yang-data+json", "Content-Type": "application/yang-data+json"}
 
-response = requests.post(cli_url, headers=headers, auth=HTTPBasicAuth(user, passwd), data=payload)
-pprint(json.loads(response.text))
+
+def run_command(cmd: str):
+    """Run one exec command on the device through NSO live-status and return the parsed reply."""
+    payload = _PAYLOAD_FMT % orjson.dumps(cmd)
+    response = _SESSION.post(cli_url, headers=headers, data=payload)
+    return orjson.loads(response.content)
+
+
+pprint(run_command("show ip interface brief"))
 
 # print(response.text)
@@ -5,19 +5,17 @@ Sync all devices from NSO.
 This should be run after reserving the NSO sandbox to ensure
 NSO's CDB has the latest device configurations.
 """
-from decouple import config
 from loguru import logger
 
 from nso_orchestration.automation.nso_client import NSOClient
+from nso_orchestration.settings import NSO_HOST, NSO_PW, NSO_USER
 
 
 def main():
     """Sync all devices from NSO."""
-    host = config("NSO_HOST", default="10.10.20.49")
+    logger.info(f"Connecting to NSO at {NSO_HOST}")
 
-    logger.info(f"Connecting to NSO at {host}")
-
-    with NSOClient(host=host) as client:
+    with NSOClient(host=NSO_HOST, username=NSO_USER, password=NSO_PW) as client:
         # Health check (just verifies NSO is reachable)
         if not client.health_check():
             logger.error("NSO is not reachable - check VPN and host")
@@ -31,16 +29,11 @@ def main():
 
         logger.info(f"Found {len(devices)} devices to sync")
 
-        # Sync each device
-        success_count = 0
-        fail_count = 0
+        # One devices/sync-from RPC; NSO syncs the devices in parallel server-side
+        results = client.sync_from_devices(devices)
 
-        for device in devices:
-            logger.info(f"Syncing {device}...")
-            if client.sync_from_device(device):
-                success_count += 1
-            else:
-                fail_count += 1
+        success_count = sum(results.values())
+        fail_count = len(results) - success_count
 
         # Summary
         logger.info("=" * 60)
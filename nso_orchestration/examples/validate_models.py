@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Validate example intents against the Pydantic models.
+
+Builds a sample NetworkIntent and a sample BGP ServiceDeploymentIntent and
+prints them back as JSON. Handy as a quick check after editing the models.
+"""
+
+from nso_orchestration.automation.intent_models import NetworkIntent
+from nso_orchestration.automation.service_models import (
+    BGPNeighborIntent,
+    BGPPeeringServiceIntent,
+    ServiceDeploymentIntent,
+)
+
+
+def network_intent_example() -> None:
+    """Validate a sample network intent."""
+    intent_data = {
+        "devices": [
+            {
+                "name": "dist-rtr01",
+                "device_type": "ios-xe",
+                "loopbacks": [
+                    {
+                        "id": 100,
+                        "ipv4": "10.100.100.1",
+                        "netmask": "255.255.255.255",
+                        "description": "Management loopback",
+                    },
+                    {
+                        "id": 200,
+                        "ipv4": "10.200.200.1",
+                        "netmask": "255.255.255.255",
+                        "description": "BGP peering",
+                    },
+                ],
+                "bgp": {
+                    "asn": 65001,
+                    "router_id": "10.100.100.1",
+                    "neighbors": [
+                        {"ip": "10.0.0.2", "remote_asn": 65002, "description": "Core router"}
+                    ],
+                },
+            }
+        ]
+    }
+
+    try:
+        intent = NetworkIntent(**intent_data)
+        print("✓ Intent validation passed!")
+        print(intent.model_dump_json(indent=2))
+    except Exception as e:
+        print(f"✗ Intent validation failed: {e}")
+
+
+def service_intent_example() -> None:
+    """Validate a sample BGP peering service intent."""
+    service_intent = ServiceDeploymentIntent(
+        service_type="bgp-peering",
+        target_devices=["dist-rtr01", "dist-rtr02"],
+        bgp_config=BGPPeeringServiceIntent(
+            local_as=65001,
+            router_id="10.100.100.1",
+            neighbors=[
+                BGPNeighborIntent(
+                    neighbor_ip="10.0.0.2",
+                    remote_as=65002,
+                    description="To core-rtr01",
+                    password="SecurePassword123",
+                )
+            ],
+            import_policy="BGP-IMPORT-POLICY",
+            export_policy="BGP-EXPORT-POLICY",
+        ),
+    )
+
+    print("✓ Service intent validation passed!")
+    print(service_intent.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    network_intent_example()
+    service_intent_example()
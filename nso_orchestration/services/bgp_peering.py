@@ -5,15 +5,96 @@ This module provides idempotent deployment of BGP peering services
 using a template-based approach.
 """
 
-from loguru import logger
+import hashlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from jinja2 import Template
+from loguru import logger
+
 from nso_orchestration.automation.nso_client import NSOClient
-from nso_orchestration.automation.service_models import BGPPeeringServiceIntent
-from nso_orchestration.automation.template_renderer import render_template
+from nso_orchestration.automation.service_models import (
+    BGPNeighborIntent,
+    BGPPeeringServiceIntent,
+    dump_neighbors,
+)
+from nso_orchestration.automation.template_renderer import get_renderer
+
+BGP_TEMPLATE = "ios-xe/bgp_service.xml.j2"
+ARTIFACT_DIR = Path("artifacts")
+
+
+@lru_cache(maxsize=1)
+def _artifact_dir() -> Path:
+    """Dry-run artifact directory, created on first use (one mkdir per process)."""
+    ARTIFACT_DIR.mkdir(exist_ok=True)
+    return ARTIFACT_DIR
+
 
+def _write_artifact(device_name: str, xml_bytes: bytes) -> Path:
+    """
+    Save a device's dry-run XML as artifacts/<device>_bgp_service.xml.
 
-def check_bgp_configured(client: NSOClient, device_name: str, intent: BGPPeeringServiceIntent) -> bool:
+    The content is stored once as artifacts/bgp_<sha1>.xml and the per-device
+    name is a relative symlink to it, so a fleet sharing one intent writes one
+    file. Falls back to a plain copy where symlinks aren't available.
+    """
+    artifact_dir = _artifact_dir()
+    digest = hashlib.sha1(xml_bytes, usedforsecurity=False).hexdigest()[:12]
+    shared = artifact_dir / f"bgp_{digest}.xml"
+    if not shared.exists():
+        shared.write_bytes(xml_bytes)
+
+    device_file = artifact_dir / f"{device_name}_bgp_service.xml"
+    device_file.unlink(missing_ok=True)
+    try:
+        device_file.symlink_to(shared.name)
+    except OSError:
+        device_file.write_bytes(xml_bytes)
+    return device_file
+
+
+@lru_cache(maxsize=1)
+def _bgp_template() -> Template:
+    """Compiled BGP service template, loaded on first use (not at import) and then reused."""
+    return get_renderer().env.get_template(BGP_TEMPLATE)
+
+
+@lru_cache(maxsize=128)
+def _render_bgp_xml(
+    local_as: int,
+    router_id: str,
+    neighbors: tuple[BGPNeighborIntent, ...],
+    import_policy: str | None,
+    export_policy: str | None,
+) -> bytes:
+    """
+    Render the BGP service XML as UTF-8 bytes, memoized on the render inputs.
+
+    Neighbor intents are frozen (hashable) models, so a fleet sharing one
+    intent (iBGP mesh, RR clients) renders once instead of once per device.
+    The output is streamed into a buffer and used as-is for both the POST
+    body and the dry-run artifact.
+    """
+    buf = io.BytesIO()
+    _bgp_template().stream(
+        local_as=local_as,
+        router_id=router_id,
+        neighbors=dump_neighbors(neighbors),
+        import_policy=import_policy,
+        export_policy=export_policy,
+    ).dump(buf, encoding="utf-8")
+    return buf.getvalue()
+
+
+def check_bgp_configured(
+    client: NSOClient,
+    device_name: str,
+    intent: BGPPeeringServiceIntent,
+    force_sync: bool = False,
+) -> bool:
     """
     Check if BGP is already configured according to intent.
 
@@ -21,6 +102,8 @@ def check_bgp_configured(client: NSOClient, device_name: str, intent: BGPPeering
         client: NSO client
         device_name: Target device
         intent: Desired BGP configuration
+        force_sync: sync-from the device first (otherwise trust NSO's CDB,
+            kept current by the regular sync_devices run)
 
     Returns:
         True if BGP matches intent (no changes needed)
@@ -28,21 +111,11 @@ def check_bgp_configured(client: NSOClient, device_name: str, intent: BGPPeering
     logger.info(f"[{device_name}] Checking if BGP already configured")
 
     try:
-        # Sync from device to get current state
-        client.sync_from_device(device_name)
+        if force_sync:
+            client.sync_from_device(device_name)
 
-        # Get device config
-        config = client.get_device_config(device_name)
-        if not config:
-            logger.warning(f"[{device_name}] Could not retrieve config")
-            return False
-
-        # Navigate to BGP config
-        bgp_config = (
-            config.get("tailf-ncs:config", {})
-            .get("tailf-ned-cisco-ios:router", {})
-            .get("bgp", {})
-        )
+        # Scoped GET: only the BGP subtree, not the whole device config
+        bgp_config = client.get_bgp_config(device_name)
 
         if not bgp_config:
             logger.info(f"[{device_name}] No BGP configuration found")
@@ -70,7 +143,8 @@ def check_bgp_configured(client: NSOClient, device_name: str, intent: BGPPeering
 
         if current_neighbor_ips != desired_neighbor_ips:
             logger.info(
-                f"[{device_name}] Neighbor mismatch: current={current_neighbor_ips}, desired={desired_neighbor_ips}")
+                f"[{device_name}] Neighbor mismatch: current={current_neighbor_ips}, desired={desired_neighbor_ips}"
+            )
             return False
 
         # If we got here, BGP is configured correctly
@@ -101,9 +175,11 @@ def deploy_bgp_service(
         Tuple of (success: bool, message: str)
     """
     logger.info(f"[{device_name}] Deploying BGP peering service")
-    logger.debug(f"  Local AS: {intent.local_as}")
-    logger.debug(f"  Router ID: {intent.router_id}")
-    logger.debug(f"  Neighbors: {[n.neighbor_ip for n in intent.neighbors]}")
+    logger.debug("  Local AS: {}", intent.local_as)
+    logger.debug("  Router ID: {}", intent.router_id)
+    logger.opt(lazy=True).debug(
+        "  Neighbors: {}", lambda: [n.neighbor_ip for n in intent.neighbors]
+    )
 
     # Idempotency check
     if not dry_run and check_bgp_configured(client, device_name, intent):
@@ -111,13 +187,12 @@ def deploy_bgp_service(
 
     # Render template
     try:
-        config_xml = render_template(
-            "ios-xe/bgp_service.xml.j2",
-            local_as=intent.local_as,
-            router_id=intent.router_id,
-            neighbors=[n.model_dump() for n in intent.neighbors],
-            import_policy=intent.import_policy,
-            export_policy=intent.export_policy
+        config_xml = _render_bgp_xml(
+            intent.local_as,
+            intent.router_id,
+            tuple(intent.neighbors),
+            intent.import_policy,
+            intent.export_policy,
         )
     except Exception as e:
         logger.error(f"[{device_name}] Template rendering failed: {e}")
@@ -128,10 +203,7 @@ def deploy_bgp_service(
         logger.info(f"[{device_name}] DRY-RUN: Would apply BGP configuration")
 
         # Optionally save artifact
-        artifact_dir = Path("artifacts")
-        artifact_dir.mkdir(exist_ok=True)
-        artifact_file = artifact_dir / f"{device_name}_bgp_service.xml"
-        artifact_file.write_text(config_xml, encoding="utf-8")
+        artifact_file = _write_artifact(device_name, config_xml)
         logger.info(f"[{device_name}] DRY-RUN: Saved artifact to {artifact_file}")
 
         return True, f"DRY-RUN: Would apply BGP config (artifact saved to {artifact_file})"
@@ -157,6 +229,50 @@ def deploy_bgp_service(
         return False, f"Exception: {e}"
 
 
+def deploy_bgp_fleet(
+    client: NSOClient,
+    intents: dict[str, BGPPeeringServiceIntent],
+    dry_run: bool = False,
+    max_workers: int = 16,
+) -> dict[str, tuple[bool, str]]:
+    """
+    Deploy BGP peering services to many devices concurrently.
+
+    Each device's deploy is dominated by NSO round-trips (the scoped BGP GET
+    for the idempotency check, then the POST), so they run on a thread pool
+    and overlap. NSOClient's httpx.Client is thread-safe and pools
+    connections, so one client is shared.
+
+    Args:
+        client: NSO client
+        intents: Device name -> BGP service intent
+        dry_run: If True, only show what would change
+        max_workers: Max devices deployed in parallel
+
+    Returns:
+        Device name -> (success, message), in input order
+    """
+    logger.info(f"Deploying BGP peering service to {len(intents)} devices ({max_workers} workers)")
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bgp-deploy") as pool:
+        futures = {
+            name: pool.submit(deploy_bgp_service, client, name, intent, dry_run)
+            for name, intent in intents.items()
+        }
+
+    results: dict[str, tuple[bool, str]] = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            logger.error(f"[{name}] Exception during BGP deployment: {e}")
+            results[name] = (False, f"Exception: {e}")
+
+    succeeded = sum(ok for ok, _ in results.values())
+    logger.info(f"BGP fleet deploy complete: {succeeded}/{len(results)} succeeded")
+    return results
+
+
 def remove_bgp_service(
         client: NSOClient,
         device_name: str,
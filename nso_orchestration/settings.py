@@ -0,0 +1,12 @@
+"""NSO connection settings, read once from the environment / .env at import.
+
+Credentials have no default: a missing NSO_USER / NSO_PW fails fast with
+decouple's UndefinedValueError instead of sending sandbox credentials to
+whatever NSO_HOST points at.
+"""
+
+from decouple import config
+
+NSO_HOST = config("NSO_HOST", default="10.10.20.49")
+NSO_USER = config("NSO_USER")
+NSO_PW = config("NSO_PW")
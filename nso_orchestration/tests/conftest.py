@@ -5,6 +5,8 @@ Provides reusable test fixtures for NSO client initialization,
 device management, and test cleanup.
 """
 
+import sys
+
 import pytest
 from decouple import config
 from loguru import logger
@@ -13,8 +15,11 @@ from nso_orchestration.automation.nso_client import NSOClient
 
 # Configure loguru for tests
 logger.remove()  # Remove default handler
-logger.add("logs/test_{time}.log", rotation="1 day", retention="7 days", level="DEBUG")
-logger.add(lambda msg: print(msg, end=""), level="INFO", colorize=True)  # Console output
+# enqueue=True: sinks write from loguru's background thread, off the test's request path
+logger.add(
+    "logs/test_{time}.log", rotation="1 day", retention="7 days", level="DEBUG", enqueue=True
+)
+logger.add(sys.stderr, level="INFO", colorize=True, enqueue=True)  # Console output
 
 
 @pytest.fixture(scope="session")
@@ -29,38 +34,31 @@ def nso_credentials():
 
 
 @pytest.fixture(scope="session")
-def nso_client_session(nso_credentials):
+def nso_client(nso_credentials):
     """
-    Session-scoped NSO client for health checks and device discovery.
+    Session-scoped NSO client shared by every test, reads and writes alike.
 
-    Use this for read-only operations that can be shared across tests.
+    httpx.Client is connection-pooled and the tests keep no client-level state,
+    so one instance (one pool, one handshake) serves the whole run; per-test
+    config cleanup is handled by fixtures like clean_loopback. The instance
+    comes from NSOClient.shared() and is closed in pytest_sessionfinish.
     """
-    logger.info("Creating session-scoped NSO client")
-    client = NSOClient(**nso_credentials)
-
-    # Verify connectivity
-    if not client.health_check():
-        pytest.skip("NSO is not reachable - skipping tests")
-
-    yield client
+    logger.info("Getting shared NSO client")
+    # Connect up front so the first test's call doesn't include the handshake
+    return NSOClient.shared(**nso_credentials, warmup=True)
 
-    logger.info("Tearing down session-scoped NSO client")
 
-
-@pytest.fixture(scope="function")
-def nso_client(nso_credentials):
+@pytest.fixture(scope="session")
+def nso_client_session(nso_client):
     """
-    Function-scoped NSO client for tests that modify configuration.
+    The shared nso_client, after a health check.
 
-    Each test gets a fresh client instance. Use this for write operations
-    to ensure proper isolation.
+    Skips the requesting tests if NSO is not reachable.
     """
-    logger.info("Creating function-scoped NSO client")
-    client = NSOClient(**nso_credentials)
-
-    yield client
+    if not nso_client.health_check():
+        pytest.skip("NSO is not reachable - skipping tests")
 
-    logger.info("Tearing down function-scoped NSO client")
+    return nso_client
 
 
 @pytest.fixture(scope="session")
@@ -81,12 +79,13 @@ def available_devices(nso_client_session):
     return devices
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_device(available_devices):
     """
     Provide a single test device for simple tests.
 
     Returns an IOS-XE device (not IOS XR), or skips if none available.
+    Session-scoped: the choice depends only on available_devices.
     """
     # Prefer IOS-XE devices (dist-rtr, internet-rtr)
     for device in available_devices:
@@ -147,12 +146,15 @@ def clean_loopback(nso_client, test_device, request):
 
     yield created_loopbacks
 
-    # Cleanup after test
+    # Cleanup after test: one transaction for all of them, per-item only as a fallback
+    if not created_loopbacks:
+        return
     logger.info(f"Cleaning up loopbacks: {created_loopbacks}")
+    if nso_client.delete_loopbacks(test_device, created_loopbacks):
+        return
     for loopback_id in created_loopbacks:
         try:
             nso_client.delete_loopback(test_device, loopback_id)
-            nso_client.commit()
         except Exception as e:
             logger.warning(f"Failed to cleanup Loopback{loopback_id}: {e}")
 
@@ -197,3 +199,13 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "nso: mark test as requiring NSO connectivity")
     config.addinivalue_line("markers", "slow: mark test as slow running")
     config.addinivalue_line("markers", "integration: mark test as integration test")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Close the shared NSO client(s) once all tests are done."""
+    NSOClient.close_shared()
+
+
+def pytest_unconfigure(config):
+    """Drain the enqueued log sinks before the interpreter exits."""
+    logger.remove()
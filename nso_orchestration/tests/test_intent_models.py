@@ -1,5 +1,7 @@
 """Tests for intent models and validation."""
 
+from types import SimpleNamespace
+
 import pytest
 from pydantic import ValidationError
 
@@ -7,7 +9,10 @@ from nso_orchestration.automation.intent_models import (
     DeviceIntent,
     LoopbackIntent,
     NetworkIntent,
+    load_devices,
 )
+from nso_orchestration.automation.service_models import BGPNeighborIntent, BGPPeeringServiceIntent
+from nso_orchestration.services.bgp_peering import check_bgp_configured
 
 
 def test_valid_loopback():
@@ -110,3 +115,107 @@ def test_mixed_deletion_policies():
 
     assert intent.devices[0].delete_unmanaged_loopbacks is False
     assert intent.devices[1].delete_unmanaged_loopbacks is True
+
+
+def test_from_trusted_round_trip():
+    """Test from_trusted rebuilds an equal intent from a validated dump."""
+    intent = NetworkIntent(
+        devices=[
+            DeviceIntent(
+                name="dist-rtr01",
+                device_type="ios-xe",
+                loopbacks=[LoopbackIntent(id=100, ipv4="10.100.100.1", netmask="255.255.255.255")],
+                bgp={"asn": 65001, "neighbors": [{"ip": "10.0.0.2", "remote_asn": 65002}]},
+            )
+        ]
+    )
+
+    rebuilt = NetworkIntent.from_trusted(intent.model_dump())
+
+    assert rebuilt == intent
+    assert isinstance(rebuilt.devices[0].loopbacks[0], LoopbackIntent)
+    assert rebuilt.devices[0].bgp.neighbors[0].remote_asn == 65002
+
+
+def test_get_device_by_name():
+    """Test get_device finds devices by name and returns None for unknown names."""
+    intent = NetworkIntent(
+        devices=[
+            DeviceIntent(name="rtr1", device_type="ios-xe"),
+            DeviceIntent(name="rtr2", device_type="ios-xr"),
+        ]
+    )
+
+    assert intent.get_device("rtr2").device_type == "ios-xr"
+    assert intent.get_device("rtr1").name == "rtr1"
+    assert intent.get_device("missing") is None
+    assert "_device_index" not in intent.model_dump()
+
+
+def test_get_device_after_model_copy_replaces_devices():
+    """Test get_device reflects the copy's devices, not the index copied from the original."""
+    a = DeviceIntent(name="a", device_type="ios-xe")
+    b = DeviceIntent(name="b", device_type="ios-xr")
+    intent = NetworkIntent(devices=[a])
+    assert intent.get_device("a") is a
+
+    copied = intent.model_copy(update={"devices": [b]})
+
+    assert copied.get_device("b") is b
+    assert copied.get_device("a") is None
+    assert intent.get_device("a") is a
+
+
+def test_intent_is_frozen_and_rejects_unknown_keys():
+    """Test intents can't be mutated in place and typo'd keys are rejected."""
+    lb = LoopbackIntent(id=100, ipv4="10.100.100.1", netmask="255.255.255.255")
+    with pytest.raises(ValidationError):
+        lb.ipv4 = "10.100.100.2"
+    assert lb.model_copy(update={"ipv4": "10.100.100.2"}).ipv4 == "10.100.100.2"
+
+    with pytest.raises(ValidationError):
+        LoopbackIntent(id=100, ipv4="10.100.100.1", netmask="255.255.255.255", descr="typo")
+
+
+def test_load_json_and_yaml(tmp_path):
+    """Test NetworkIntent.load accepts JSON and YAML files and load_devices validates bare lists."""
+    devices = [{"name": "rtr1", "device_type": "ios-xe", "loopbacks": []}]
+    json_file = tmp_path / "intent.json"
+    json_file.write_text(
+        '{"devices": [{"name": "rtr1", "device_type": "ios-xe", "loopbacks": []}]}'
+    )
+    yaml_file = tmp_path / "intent.yaml"
+    yaml_file.write_text("devices:\n  - name: rtr1\n    device_type: ios-xe\n")
+
+    assert NetworkIntent.load(json_file) == NetworkIntent.load(yaml_file)
+    assert load_devices(devices) == NetworkIntent.load(json_file).devices
+    with pytest.raises(ValidationError):
+        load_devices(b'[{"name": "rtr1", "device_type": "junos"}]')
+
+
+def test_netmask_contiguity():
+    """Test every prefix-length mask is accepted and non-contiguous or non-canonical ones are not."""
+    for prefix in range(33):
+        mask = ".".join(str(b) for b in ((0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF).to_bytes(4))
+        LoopbackIntent(id=1, ipv4="10.0.0.1", netmask=mask)
+    for bad in ("255.255.0.255", "128.0.0.1", "255.0", "0xff.0.0.0"):
+        with pytest.raises(ValidationError):
+            LoopbackIntent(id=1, ipv4="10.0.0.1", netmask=bad)
+
+
+def test_bgp_check_sees_neighbors_changed_via_model_copy():
+    """Test check_bgp_configured compares against a model_copy'd intent's own neighbors."""
+    intent = BGPPeeringServiceIntent(
+        local_as=65001,
+        router_id="10.100.100.1",
+        neighbors=[BGPNeighborIntent(neighbor_ip="10.0.0.1", remote_as=65002)],
+    )
+    device_bgp = {"as-no": 65001, "bgp-router-id": "10.100.100.1", "neighbor": [{"id": "10.0.0.1"}]}
+    client = SimpleNamespace(get_bgp_config=lambda device_name: device_bgp)
+
+    assert check_bgp_configured(client, "rtr1", intent) is True
+
+    changed = intent.model_copy(
+        update={"neighbors": [BGPNeighborIntent(neighbor_ip="10.0.0.9", remote_as=65002)]}
+    )
+    assert check_bgp_configured(client, "rtr1", changed) is False
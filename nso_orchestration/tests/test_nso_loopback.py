@@ -9,9 +9,13 @@ Tests cover:
 - Rollback on failure
 """
 
+import asyncio
+
 import pytest
 from loguru import logger
 
+from nso_orchestration.automation.nso_client import AsyncNSOClient
+
 
 @pytest.mark.nso
 class TestNSOConnectivity:
@@ -37,7 +41,11 @@ class TestNSOConnectivity:
 class TestLoopbackConfiguration:
     """Test loopback interface configuration via NSO."""
 
-    def test_create_loopback(self, nso_client, sync_device, test_loopback_config):
+    # Distinct ids/addresses so the cases can run on different workers under
+    # `-n auto` (--dist=loadgroup spreads ungrouped tests individually).
+    # 200 and 250 belong to the dry-run and rollback tests below
+    @pytest.mark.parametrize("loopback_id", ["201", "202", "203", "204"])
+    def test_create_loopback(self, nso_client, sync_device, test_loopback_config, loopback_id):
         """
         Test creating a loopback interface.
 
@@ -48,7 +56,11 @@ class TestLoopbackConfiguration:
         4. Verify loopback exists (post-check)
         5. Cleanup
         """
-        loopback_id = test_loopback_config["loopback_id"]
+        test_loopback_config = {
+            **test_loopback_config,
+            "loopback_id": loopback_id,
+            "ip_address": f"10.{loopback_id}.{loopback_id}.1",
+        }
         device = sync_device
 
         # PRE-CHECK: Ensure loopback doesn't exist
@@ -87,11 +99,13 @@ class TestLoopbackConfiguration:
         ]
 
         try:
-            # Create all loopbacks
-            for config in loopbacks:
-                logger.info(f"Creating Loopback{config['loopback_id']}")
-                result = nso_client.configure_loopback(device, **config)
-                assert result is True, f"Failed to configure Loopback{config['loopback_id']}"
+            # Create all loopbacks in one PATCH (one NSO transaction)
+            specs = [
+                (c["loopback_id"], c["ip_address"], c["netmask"], c.get("description"))
+                for c in loopbacks
+            ]
+            result = nso_client.configure_loopbacks(device, specs)
+            assert result is True, "Failed to configure loopbacks in one transaction"
 
             # Verify all exist
             nso_client.sync_from_device(device)
@@ -102,10 +116,40 @@ class TestLoopbackConfiguration:
                 assert interface is not None, f"Loopback{config['loopback_id']} not found"
 
         finally:
-            # Cleanup
+            # Cleanup (one transaction)
             logger.info("Cleaning up test loopbacks")
-            for config in loopbacks:
-                nso_client.delete_loopback(device, config["loopback_id"])
+            nso_client.delete_loopbacks(device, [c["loopback_id"] for c in loopbacks])
+
+    def test_create_multiple_loopbacks_concurrently(self, nso_credentials, sync_device):
+        """Test creating loopbacks concurrently over one async client."""
+        device = sync_device
+        loopbacks = [
+            {"loopback_id": "111", "ip_address": "10.111.111.1", "netmask": "255.255.255.255"},
+            {"loopback_id": "112", "ip_address": "10.112.112.1", "netmask": "255.255.255.255"},
+            {"loopback_id": "113", "ip_address": "10.113.113.1", "netmask": "255.255.255.255"},
+        ]
+
+        async def _run():
+            async with AsyncNSOClient(**nso_credentials) as client:
+                try:
+                    created = await asyncio.gather(
+                        *(client.configure_loopback(device, **c) for c in loopbacks)
+                    )
+                    assert all(r is True for r in created), f"Create results: {created}"
+
+                    found = await asyncio.gather(
+                        *(
+                            client.get_interface_config(device, "Loopback", c["loopback_id"])
+                            for c in loopbacks
+                        )
+                    )
+                    assert all(found), "Not all loopbacks found after concurrent create"
+                finally:
+                    await asyncio.gather(
+                        *(client.delete_loopback(device, c["loopback_id"]) for c in loopbacks)
+                    )
+
+        asyncio.run(_run())
 
     def test_dry_run_loopback(self, nso_client, sync_device, test_loopback_config):
         """Test dry-run mode shows changes without applying them."""
@@ -133,6 +177,10 @@ class TestLoopbackConfiguration:
 
         logger.info("✓ Dry-run test passed - no changes applied")
 
+    # rollback(0) undoes the most recent NSO commit, whoever made it, so this test gets
+    # its own xdist group (one worker, never batched with other tests). Other workers
+    # can still commit in between: against a shared NSO, run it on its own (-n 0)
+    @pytest.mark.xdist_group("nso_rollback")
     def test_rollback_loopback(self, nso_client, sync_device):
         """Test rollback functionality after creating a loopback."""
         device = sync_device